@@ -0,0 +1,222 @@
+"""
+Application Analytics
+Funnel, weekly, per-source and time-to-response views over application history
+"""
+
+import json
+import os
+import tempfile
+import threading
+from datetime import date
+
+from application_tracker import FUNNEL_STAGES, RESPONDED_STATUSES
+
+# Days from applying to the first response, bucketed as (label, max days)
+RESPONSE_BUCKETS = (
+    ('0-3 days', 3),
+    ('4-7 days', 7),
+    ('8-14 days', 14),
+    ('15-30 days', 30),
+    ('31+ days', None),
+)
+
+# Counters kept per week, per source and per platform
+ROLLUP_FIELDS = ('applications', 'responses', 'interviews', 'offers')
+
+APPLIED_STAGE = FUNNEL_STAGES.index('Applied')
+INTERVIEW_STAGE = FUNNEL_STAGES.index('Interview Scheduled')
+OFFER_STAGE = FUNNEL_STAGES.index('Offer')
+
+
+def _day(timestamp):
+    """Date part of a 'YYYY-MM-DD[ HH:MM:SS]' timestamp"""
+    return date.fromisoformat(timestamp[:10])
+
+
+def _week(timestamp):
+    """ISO week of a timestamp, e.g. '2025-W41'"""
+    year, week, _ = _day(timestamp).isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _response_bucket(days):
+    """Histogram bucket label for a response time in days"""
+    for label, max_days in RESPONSE_BUCKETS:
+        if max_days is None or days <= max_days:
+            return label
+
+
+def _empty_views():
+    """Views before any events have been applied"""
+    return {
+        'funnel': {stage: 0 for stage in FUNNEL_STAGES},
+        'weekly': {},
+        'by_source': {},
+        'by_platform': {},
+        'response_histogram': {label: 0 for label, _ in RESPONSE_BUCKETS},
+        'response_days_total': 0,
+    }
+
+
+class ApplicationAnalytics:
+    """Materialized analytics views kept up to date from the tracker's event log
+
+    Views are updated incrementally: each refresh only reads events logged
+    since the last one. They are saved next to the tracker database (with
+    the log position they cover), so they survive restarts without a rescan.
+    """
+
+    def __init__(self, tracker, state_path=None):
+        self.tracker = tracker
+        self.state_path = state_path or tracker.db_path + '.analytics.json'
+        self._lock = threading.Lock()
+
+        try:
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            self.position, self.views, self._apps = state['position'], state['views'], state['apps']
+        except (FileNotFoundError, ValueError, KeyError):
+            self._reset()
+
+    def _reset(self):
+        """Forget everything and start again from the beginning of the log"""
+        self.position = 0
+        self.views = _empty_views()
+        # Per-application progress, keyed by str(app_id) to match the saved JSON
+        self._apps = {}
+
+    def _save_state(self):
+        """Write the views and log position atomically"""
+        state = {'position': self.position, 'views': self.views, 'apps': self._apps}
+        state_dir = os.path.dirname(os.path.abspath(self.state_path))
+        fd, tmp_path = tempfile.mkstemp(dir=state_dir, prefix='.analytics-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(tmp_path, self.state_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def refresh(self):
+        """Apply events logged since the last refresh; returns how many were applied"""
+        with self._lock:
+            new_events = self.tracker.events_since(self.position)
+            if new_events is None:
+                # The log was replaced; rebuild from scratch
+                self._reset()
+                new_events = self.tracker.events_since(0)
+
+            events, position = new_events
+            for event in events:
+                self._apply(event)
+
+            if position != self.position:
+                self.position = position
+                self._save_state()
+            return len(events)
+
+    def _rollup(self, table, key):
+        """Counters for one row of a rollup view, created on first use"""
+        return self.views[table].setdefault(key, dict.fromkeys(ROLLUP_FIELDS, 0))
+
+    def _count(self, app, field):
+        """Add one to a counter in every rollup the application belongs to"""
+        self._rollup('weekly', app['week'])[field] += 1
+        self._rollup('by_source', app['source'])[field] += 1
+        self._rollup('by_platform', app['platform'])[field] += 1
+
+    def _apply(self, event):
+        """Fold one event into the views"""
+        key = str(event['app_id'])
+        app = self._apps.get(key)
+        if app is None:
+            # Weekly rollups are cohorts: keyed by the week the application was added
+            app = self._apps[key] = {
+                'week': _week(event['at']),
+                'source': event.get('source') or 'Unknown',
+                'platform': event.get('platform') or 'Unknown',
+                'stage': -1,
+                'applied_at': None,
+                'responded': False,
+            }
+            self._count(app, 'applications')
+
+        if event.get('status'):
+            self._apply_status(app, event['status'], event['at'])
+
+    def _apply_status(self, app, status, at):
+        """Advance an application's funnel stage and response tracking"""
+        stage = FUNNEL_STAGES.index(status) if status in FUNNEL_STAGES else -1
+        if stage > app['stage']:
+            # Reaching a stage counts every stage before it too
+            for reached in range(app['stage'] + 1, stage + 1):
+                self.views['funnel'][FUNNEL_STAGES[reached]] += 1
+            if app['stage'] < INTERVIEW_STAGE <= stage:
+                self._count(app, 'interviews')
+            if app['stage'] < OFFER_STAGE <= stage:
+                self._count(app, 'offers')
+            app['stage'] = stage
+
+        if stage >= APPLIED_STAGE and app['applied_at'] is None:
+            app['applied_at'] = at[:10]
+
+        if status in RESPONDED_STATUSES and not app['responded']:
+            app['responded'] = True
+            self._count(app, 'responses')
+            if app['applied_at'] is not None:
+                days = max(0, (_day(at) - _day(app['applied_at'])).days)
+                self.views['response_histogram'][_response_bucket(days)] += 1
+                self.views['response_days_total'] += days
+
+    def get_views(self):
+        """Refresh and return the analytics views, ready to serialize"""
+        self.refresh()
+
+        with self._lock:
+            views = self.views
+
+            funnel = []
+            previous = None
+            for stage in FUNNEL_STAGES:
+                count = views['funnel'][stage]
+                conversion = count / previous * 100 if previous else None
+                funnel.append({'stage': stage, 'count': count, 'conversion': conversion})
+                previous = count
+
+            timed = sum(views['response_histogram'].values())
+            return {
+                'funnel': funnel,
+                'weekly': {week: dict(row) for week, row in sorted(views['weekly'].items())},
+                'by_source': {source: dict(row) for source, row in views['by_source'].items()},
+                'by_platform': {platform: dict(row) for platform, row in views['by_platform'].items()},
+                'time_to_response': {
+                    'histogram': dict(views['response_histogram']),
+                    'average_days': views['response_days_total'] / timed if timed else None,
+                },
+                'applications': len(self._apps),
+            }
+
+
+def main():
+    """Print the analytics views for the default tracker"""
+    from application_tracker import ApplicationTracker
+
+    views = ApplicationAnalytics(ApplicationTracker()).get_views()
+
+    print("\n📈 CONVERSION FUNNEL")
+    for row in views['funnel']:
+        conversion = f" ({row['conversion']:.0f}%)" if row['conversion'] is not None else ''
+        print(f"   {row['stage']}: {row['count']}{conversion}")
+
+    print("\n⏱️  TIME TO RESPONSE")
+    for label, count in views['time_to_response']['histogram'].items():
+        print(f"   {label}: {count}")
+
+    print("\n🌐 BY SOURCE")
+    for source, row in views['by_source'].items():
+        print(f"   {source}: {row['applications']} applications, {row['interviews']} interviews")
+
+
+if __name__ == "__main__":
+    main()
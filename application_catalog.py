@@ -0,0 +1,262 @@
+"""
+Application Catalog
+In-memory index of the application_info.json files in the batch folders
+"""
+
+import json
+import os
+import threading
+import uuid
+
+from job_scoring import get_engine
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    Observer = None
+
+INFO_FILE = 'application_info.json'
+
+# Seconds between mtime scans; with watchdog the scan is only a safety net
+# for missed events and for batch folders created after startup
+POLL_INTERVAL = 2.0
+WATCHDOG_POLL_INTERVAL = 30.0
+
+
+def _stamp(path):
+    """(mtime, size) of a file, or None if it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+if Observer is not None:
+    class _CatalogEventHandler(FileSystemEventHandler):
+        """Marks the application folders touched by filesystem events"""
+
+        def __init__(self, catalog):
+            super().__init__()
+            self.catalog = catalog
+
+        def on_any_event(self, event):
+            for path in (event.src_path, getattr(event, 'dest_path', None)):
+                if path:
+                    self.catalog.invalidate_path(os.fsdecode(path))
+
+
+class ApplicationCatalog:
+    """Application infos loaded once and kept current as folders change
+
+    Changes are picked up with watchdog (inotify/FSEvents) when it is
+    installed, and by a background mtime scan otherwise; only files that
+    changed are parsed again. Reads are served from memory.
+    """
+
+    def __init__(self, batch_dirs, engine=None, watch=True):
+        self.batch_dirs = [os.path.abspath(batch_dir) for batch_dir in batch_dirs]
+        self.engine = engine or get_engine()
+        self.version = 0
+        # Tells this catalog's versions apart from those before a restart
+        self._instance = uuid.uuid4().hex[:8]
+
+        # 'batch/company' folder -> {'path', 'stamp', 'info'}
+        self._entries = {}
+        self._snapshot = None
+        self._snapshot_key = None
+        self._lock = threading.RLock()
+
+        # Invalidations not applied yet; their own lock so watcher threads
+        # never wait on a scan
+        self._dirty = set()
+        self._rescan = False
+        self._pending_lock = threading.Lock()
+
+        self._observer = None
+        self._watched = set()
+        self._stop = threading.Event()
+        self._poller = None
+
+        self.scan()
+        if watch:
+            self._start_watching()
+
+    def _start_watching(self):
+        """Start watchdog (if installed) and the background mtime scan"""
+        poll_interval = POLL_INTERVAL
+        if Observer is not None:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._watch_batch_dirs()
+            self._observer.start()
+            poll_interval = WATCHDOG_POLL_INTERVAL
+
+        self._poller = threading.Thread(target=self._poll, args=(poll_interval,), daemon=True)
+        self._poller.start()
+
+    def _watch_batch_dirs(self):
+        """Schedule watches for batch folders that exist and aren't watched yet"""
+        if self._observer is None:
+            return
+        for batch_dir in self.batch_dirs:
+            if batch_dir not in self._watched and os.path.isdir(batch_dir):
+                self._observer.schedule(_CatalogEventHandler(self), batch_dir, recursive=True)
+                self._watched.add(batch_dir)
+
+    def _poll(self, interval):
+        """Rescan every interval seconds until closed"""
+        while not self._stop.wait(interval):
+            try:
+                self.scan()
+            except Exception as e:
+                print(f"⚠️  Application catalog scan failed: {e}")
+
+    def close(self):
+        """Stop watching for changes"""
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _folder_for(self, path):
+        """The 'batch/company' folder a path lies in, or None"""
+        for batch_dir in self.batch_dirs:
+            if path.startswith(batch_dir + os.sep):
+                company_folder = path[len(batch_dir) + 1:].split(os.sep, 1)[0]
+                return os.path.join(os.path.basename(batch_dir), company_folder)
+        return None
+
+    def invalidate_path(self, path):
+        """Note that something under path changed; it is reloaded on next read"""
+        path = os.path.abspath(path)
+        folder = self._folder_for(path)
+        with self._pending_lock:
+            if folder is not None:
+                self._dirty.add(folder)
+            elif path in self.batch_dirs:
+                self._rescan = True
+
+    def invalidate(self, folder=None):
+        """Reload one 'batch/company' folder (or everything) on next read"""
+        with self._pending_lock:
+            if folder is None:
+                self._rescan = True
+            else:
+                self._dirty.add(folder)
+
+    def _batch_path(self, folder):
+        """Absolute path of a 'batch/company' folder"""
+        batch_name, company_folder = os.path.split(folder)
+        for batch_dir in self.batch_dirs:
+            if os.path.basename(batch_dir) == batch_name:
+                return os.path.join(batch_dir, company_folder)
+        return None
+
+    def _load(self, folder, path):
+        """Bring one folder's entry up to date; returns True if it changed"""
+        info_file = os.path.join(path, INFO_FILE) if path else None
+        stamp = _stamp(info_file) if info_file else None
+        entry = self._entries.get(folder)
+
+        if stamp is None:
+            if entry is None:
+                return False
+            del self._entries[folder]
+            return True
+        if entry is not None and entry['stamp'] == stamp:
+            return False
+
+        try:
+            with open(info_file, 'r') as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            # Probably still being written; the next change reloads it
+            return False
+
+        self._entries[folder] = {'path': path, 'stamp': stamp, 'info': info}
+        return True
+
+    def scan(self):
+        """Check every folder's mtime and reload the ones that changed"""
+        with self._lock:
+            # Changes from here on are caught by this scan or the next read
+            with self._pending_lock:
+                self._rescan = False
+                self._dirty.clear()
+
+            seen = set()
+            changed = False
+            for batch_dir in self.batch_dirs:
+                try:
+                    company_folders = os.listdir(batch_dir)
+                except OSError:
+                    continue
+                for company_folder in company_folders:
+                    path = os.path.join(batch_dir, company_folder)
+                    folder = os.path.join(os.path.basename(batch_dir), company_folder)
+                    seen.add(folder)
+                    changed |= self._load(folder, path)
+
+            for folder in set(self._entries) - seen:
+                del self._entries[folder]
+                changed = True
+
+            self._watch_batch_dirs()
+            if changed:
+                self.version += 1
+            return changed
+
+    def _sync(self):
+        """Apply invalidations recorded since the last read"""
+        with self._pending_lock:
+            rescan, dirty = self._rescan, self._dirty
+            self._rescan, self._dirty = False, set()
+
+        if rescan:
+            self.scan()
+        elif dirty:
+            changed = False
+            for folder in dirty:
+                changed |= self._load(folder, self._batch_path(folder))
+            if changed:
+                self.version += 1
+
+    def applications(self):
+        """All applications with 'folder' and 'priority_score' filled in
+
+        The dicts are shared between calls; copy one before changing it.
+        """
+        with self._lock:
+            self._sync()
+
+            # Scores computed here follow the scoring rules, so rebuild if they change
+            key = (self.version, self.engine.rules_hash)
+            if self._snapshot_key != key:
+                snapshot = []
+                for folder in sorted(self._entries):
+                    app_info = dict(self._entries[folder]['info'], folder=folder)
+                    if 'priority_score' not in app_info:
+                        app_info['priority_score'] = self.engine.score(app_info)
+                    snapshot.append(app_info)
+                self._snapshot, self._snapshot_key = snapshot, key
+            return list(self._snapshot)
+
+    def data_version(self):
+        """Token that changes whenever applications() would return something new"""
+        with self._lock:
+            self._sync()
+            return f"{self._instance}:{self.version}:{self.engine.rules_hash}"
+
+    def find(self, **fields):
+        """(folder, info file path) of the first application matching all fields"""
+        with self._lock:
+            self._sync()
+            for folder in sorted(self._entries):
+                entry = self._entries[folder]
+                info = entry['info']
+                if all(info.get(name) == value for name, value in fields.items()):
+                    return folder, os.path.join(entry['path'], INFO_FILE)
+        return None
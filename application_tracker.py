@@ -3,36 +3,552 @@ Application Tracking Dashboard
 Track and manage all your job applications with analytics
 """
 
+import bisect
+import heapq
 import json
-import pandas as pd
-from datetime import datetime
+import math
+import re
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import atexit
 import os
+import tempfile
+import threading
+from urllib.parse import urlparse
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: no advisory locks, saves fall back to single-process behavior
+    fcntl = None
+
+# Keyword arguments accepted by add_application, and the ones that must be set
+APPLICATION_FIELDS = ('job_title', 'company', 'job_url', 'location', 'status', 'date_applied', 'notes', 'source')
+REQUIRED_FIELDS = ('job_title', 'company', 'job_url')
+
+# Statuses that count as hearing back from the employer
+RESPONDED_STATUSES = ('Interview Scheduled', 'Offer', 'Rejected')
+
+# Statuses that end an application; their follow-ups are dropped
+CLOSED_STATUSES = ('Rejected', 'Offer', 'Withdrawn')
+
+# Conversion funnel, in order; reaching a stage implies the ones before it
+FUNNEL_STAGES = ('Prepared', 'Applied', 'Interview Scheduled', 'Offer')
+
+# Searchable fields and how much a match in each counts towards relevance;
+# 'history' is the notes left on status changes, follow-ups and add_note
+SEARCH_FIELD_WEIGHTS = {'job_title': 3, 'company': 2, 'notes': 1, 'history': 1}
+
+# Words for search: letters and digits, keeping trailing + and # (C++, C#)
+TOKEN_PATTERN = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+
+def tokenize(text):
+    """Split text into lowercase search tokens"""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _parse_applications(data):
+    """Normalize tracker file contents to (applications, next_id, version)
+
+    Handles both the current {'version': ..., 'next_id': ...,
+    'applications': [...]} layout and the original bare list of applications.
+    """
+    if isinstance(data, list):
+        applications, next_id, version = data, 1, 0
+    else:
+        applications = data.get('applications', [])
+        next_id, version = data.get('next_id', 1), data.get('version', 0)
+
+    # Never hand out an ID that is already taken
+    next_id = max([next_id] + [app['id'] + 1 for app in applications])
+    return applications, next_id, version
+
+
+def load_applications_file(path):
+    """Read a tracker file and return (applications, next_id, version)"""
+    with open(path, 'r') as f:
+        return _parse_applications(json.load(f))
+
+
+def make_event(event_type, at=None, **fields):
+    """Build a history event: 'created', 'status', 'follow_up' or 'note'
+
+    Empty fields are left out to keep the log compact.
+    """
+    event = {'at': at or datetime.now().strftime('%Y-%m-%d %H:%M:%S'), 'type': event_type}
+    event.update((key, value) for key, value in fields.items() if value)
+    return event
+
+
+def job_platform(url):
+    """Site a job was posted on, from its URL ('seek.com.au', 'linkedin.com', ...)"""
+    host = urlparse(url or '').hostname or ''
+    return (host[4:] if host.startswith('www.') else host) or None
+
+
+def funnel_counts(events):
+    """Count applications reaching each FUNNEL_STAGES stage from their events"""
+    furthest = {}
+    for event in events:
+        if event.get('status') in FUNNEL_STAGES:
+            stage = FUNNEL_STAGES.index(event['status'])
+            furthest[event['app_id']] = max(stage, furthest.get(event['app_id'], 0))
+
+    return {stage: sum(1 for reached in furthest.values() if reached >= index)
+            for index, stage in enumerate(FUNNEL_STAGES)}
+
+
+def _date_key(value=None):
+    """Normalize a date, datetime or 'YYYY-MM-DD' string (default today)"""
+    if value is None:
+        value = datetime.now()
+    if hasattr(value, 'strftime'):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def _file_stamp(stat_result):
+    """Identify one version of the tracker file on disk"""
+    return (stat_result.st_ino, stat_result.st_mtime_ns, stat_result.st_size)
+
 
 class ApplicationTracker:
-    def __init__(self, db_path=None):
-        """Initialize tracker"""
+    def __init__(self, db_path=None, write_behind=False, flush_interval=2.0, flush_batch_size=100):
+        """Initialize tracker
+
+        With write_behind=True, mutations are coalesced and written at most
+        every flush_interval seconds or every flush_batch_size changes,
+        whichever comes first.
+        """
         if db_path is None:
             base_dir = os.path.dirname(os.path.abspath(__file__))
             db_path = os.path.join(base_dir, 'applications.json')
         """Initialize tracker with database"""
         self.db_path = db_path
 
+        # Write-behind state
+        self.write_behind = write_behind
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._batch_depth = 0
+        self._flush_timer = None
+        if write_behind:
+            atexit.register(self.flush)
+
+        # Callbacks run by dispatch_due_reminders, and the follow-ups
+        # already reminded about as (follow_up_date, app_id)
+        self.reminder_hooks = []
+        self._reminded = set()
+
+        # Changes not yet saved, so they can be replayed over another
+        # process's newer copy of the file
+        self._dirty_ids = set()
+        self._new_apps = []
+
+        # IDs reserved in the shared ID file but not handed out yet
+        self.next_id_path = db_path + '.next_id'
+        self._reserved_ids = deque()
+
+        # History is an append-only log next to the database. Events are
+        # written with the next save; the log is read lazily and then tailed.
+        self.events_path = os.path.splitext(db_path)[0] + '.events.jsonl'
+        self._pending_events = []
+        self._pending_notes = {}
+        self._events = None
+        self._events_by_app = {}
+        self._events_offset = 0
+
         # Load existing applications or create new
-        if os.path.exists(db_path):
-            with open(db_path, 'r') as f:
-                self.applications = json.load(f)
-        else:
-            self.applications = []
+        self.applications, self.next_id, self.version, self._disk_stamp = self._read_disk()
+        self._reindex()
+
+        if self.applications and not os.path.exists(self.events_path):
+            self._start_event_log()
+
+    def _read_disk(self):
+        """Read the tracker file; returns (applications, next_id, version, stamp)
+
+        Saves replace the file atomically, so this never needs the lock and
+        always sees one complete version.
+        """
+        try:
+            with open(self.db_path, 'r') as f:
+                stamp = _file_stamp(os.fstat(f.fileno()))
+                return _parse_applications(json.load(f)) + (stamp,)
+        except FileNotFoundError:
+            return [], 1, 0, None
+
+    def _current_stamp(self):
+        """Stamp of the tracker file as it is on disk right now"""
+        try:
+            return _file_stamp(os.stat(self.db_path))
+        except FileNotFoundError:
+            return None
+
+    @contextmanager
+    def _file_lock(self):
+        """Hold an exclusive cross-process lock for a save
+
+        Yields the lock file, which holds the version of the last save, or
+        None where file locking isn't available.
+        """
+        if fcntl is None:
+            yield None
+            return
+
+        with open(self.db_path + '.lock', 'a+') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield lock_file
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _changed_on_disk(self, lock_file):
+        """Whether another process has saved since we last read or wrote"""
+        if lock_file is not None:
+            lock_file.seek(0)
+            saved_version = lock_file.read().strip()
+            if saved_version:
+                return int(saved_version) != self.version
+
+        # No recorded version (first save, or no locking): compare file stamps
+        return self._current_stamp() != self._disk_stamp
+
+    def _start_event_log(self):
+        """Give applications from before the event log a 'created' event"""
+        with self._lock, self._file_lock():
+            if os.path.exists(self.events_path):
+                return
+            self._append_events([
+                (app, make_event('created', at=app['date_updated'] or app['date_applied'], status=app['status'],
+                                 source=app.get('source'), platform=job_platform(app.get('job_url'))))
+                for app in self.applications
+            ])
+
+    def _record_event(self, app, event_type, **fields):
+        """Queue a history event for an application; written by the next save"""
+        event = make_event(event_type, **fields)
+        self._pending_events.append((app, event))
+        if event.get('note'):
+            self._pending_notes.setdefault(app['id'], []).append(event['note'])
+
+    def _append_events(self, pending):
+        """Append (app, event) pairs to the event log in one write"""
+        lines = [json.dumps({'app_id': app['id'], **event}, separators=(',', ':')) for app, event in pending]
+        with open(self.events_path, 'a') as f:
+            f.write('\n'.join(lines) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def events_since(self, position=0):
+        """Saved events after a log position; returns (events, new_position)
+
+        Positions are opaque (a byte offset here, a sequence number in
+        SQLite); start from 0. Returns None if the log no longer reaches
+        position, meaning it was replaced and readers should start over.
+        """
+        try:
+            with open(self.events_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < position:
+                    return None
+                f.seek(position)
+                data = f.read()
+        except FileNotFoundError:
+            return None if position else ([], 0)
+
+        # Leave a partly written last line for the next call
+        end = data.rfind(b'\n') + 1
+        events = [json.loads(line) for line in data[:end].splitlines() if line.strip()]
+        return events, position + end
+
+    def _load_events(self):
+        """Read events appended to the log since the last call"""
+        with self._lock:
+            if self._events is None:
+                self._events, self._events_by_app, self._events_offset = [], {}, 0
+
+            new_events = self.events_since(self._events_offset)
+            if new_events is None:
+                self._events = None
+                return self._load_events()
+
+            events, self._events_offset = new_events
+            for event in events:
+                self._events.append(event)
+                self._events_by_app.setdefault(event['app_id'], []).append(event)
+
+            # Notes from other processes become searchable too
+            for app_id in {event['app_id'] for event in events if event.get('note')}:
+                app = self._by_id.get(app_id)
+                if app is not None:
+                    self._unindex_text(app)
+                    self._index_text(app)
+
+    def _unsaved_events(self):
+        """Queued events, with the IDs their applications have now"""
+        return [{'app_id': app['id'], **event} for app, event in self._pending_events]
+
+    def _all_events(self):
+        """Every event, oldest first"""
+        with self._lock:
+            self._load_events()
+            return self._events + self._unsaved_events()
+
+    def get_history(self, app_id):
+        """Status changes, follow-ups and notes for an application, oldest first"""
+        with self._lock:
+            self._load_events()
+            return (self._events_by_app.get(app_id, []) +
+                    [event for event in self._unsaved_events() if event['app_id'] == app_id])
+
+    def get_timeline(self, since=None, limit=None):
+        """Events across all applications, newest first, optionally since a date"""
+        events = self._all_events()
+        if since is not None:
+            since = _date_key(since)
+            events = [event for event in events if event['at'] >= since]
+        return events[::-1][:limit]
+
+    def get_funnel(self):
+        """How many applications reached each stage of FUNNEL_STAGES"""
+        return funnel_counts(self._all_events())
+
+    def _merge_from_disk(self):
+        """Load the newest file and replay our unsaved changes on top of it
+
+        Records we changed win over the file's copy. Applications we added
+        keep their IDs: those were reserved in the shared ID file, so no
+        other process can have used them.
+        """
+        applications, next_id, version, stamp = self._read_disk()
+
+        new_ids = {app['id'] for app in self._new_apps}
+
+        merged = []
+        for app in applications:
+            if app['id'] in self._dirty_ids and app['id'] not in new_ids:
+                app = self._by_id[app['id']]
+            merged.append(app)
+        merged.extend(self._new_apps)
+
+        self.applications = merged
+        self.next_id = max(next_id, self.next_id)
+        self.version = version
+        self._disk_stamp = stamp
+        self._reindex()
+
+    def refresh(self):
+        """Pick up saves made by other processes
+
+        Returns True if the file had changed. Unsaved local changes are kept
+        and written by the next save.
+        """
+        with self._lock:
+            if self._current_stamp() == self._disk_stamp:
+                return False
+            self._merge_from_disk()
+            return True
+
+    def _reindex(self):
+        """Rebuild the in-memory indexes and running statistics"""
+        self._by_id = {}
+        self._status_counts = Counter()
+        self._company_counts = Counter()
+        self._daily_counts = Counter()
+        self._responded = 0
+
+        # The search index is built on the first search
+        self._postings = None
+
+        # Open follow-ups sorted by (follow_up_date, app_id), and a min-heap
+        # of the ones not yet reminded about. Heap entries are checked when
+        # popped, so changes never have to search the heap.
+        self._followups = []
+        self._reminder_queue = []
+        self._queued = set()
+
+        for app in self.applications:
+            self._index(app)
+
+    def _index(self, app):
+        """Add an application to the indexes and running statistics"""
+        self._by_id[app['id']] = app
+        self._status_counts[app['status']] += 1
+        self._company_counts[app['company']] += 1
+        self._daily_counts[(app['date_applied'] or '')[:10]] += 1
+        if app['status'] in RESPONDED_STATUSES:
+            self._responded += 1
+        self._index_text(app)
+        self._index_followup(app)
+
+    def _unindex(self, app):
+        """Remove an application's contribution to the running statistics"""
+        for counts, key in ((self._status_counts, app['status']),
+                            (self._company_counts, app['company']),
+                            (self._daily_counts, (app['date_applied'] or '')[:10])):
+            counts[key] -= 1
+            if not counts[key]:
+                del counts[key]
+        if app['status'] in RESPONDED_STATUSES:
+            self._responded -= 1
+        self._unindex_text(app)
+        self._unindex_followup(app)
+
+    def _build_search_index(self):
+        """Build the inverted index used by search_applications
+
+        _postings maps token -> {app_id: weight}, _doc_tokens keeps each
+        application's token weights so it can be removed again, and
+        _vocabulary is the sorted token list for prefix lookups.
+        """
+        self._load_events()
+        self._postings = {}
+        self._doc_tokens = {}
+        self._vocabulary = None
+        for app in self.applications:
+            self._index_text(app)
+        self._vocabulary = sorted(self._postings)
+
+    def _index_text(self, app):
+        """Add an application's searchable fields to the inverted index"""
+        if self._postings is None:
+            return
+
+        weights = Counter()
+        for field, field_weight in SEARCH_FIELD_WEIGHTS.items():
+            text = self._history_text(app) if field == 'history' else app.get(field) or ''
+            for token, count in Counter(tokenize(text)).items():
+                # Repeats count for less than fresh matches, so long notes
+                # don't drown out a title match
+                weights[token] += field_weight * (1 + math.log(count))
+
+        self._doc_tokens[app['id']] = weights
+        for token, weight in weights.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                if self._vocabulary is not None:
+                    bisect.insort(self._vocabulary, token)
+            postings[app['id']] = weight
+
+    def _history_text(self, app):
+        """Every note in an application's history, saved or not"""
+        notes = [event['note'] for event in self._events_by_app.get(app['id'], ()) if event.get('note')]
+        return ' '.join(notes + self._pending_notes.get(app['id'], []))
+
+    def _unindex_text(self, app):
+        """Remove an application from the inverted index"""
+        if self._postings is None:
+            return
+
+        for token in self._doc_tokens.pop(app['id'], ()):
+            postings = self._postings[token]
+            del postings[app['id']]
+            if not postings:
+                del self._postings[token]
+                del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+
+    def _index_followup(self, app):
+        """Schedule an application's follow-up if it has an open one"""
+        if not app['follow_up_date'] or app['status'] in CLOSED_STATUSES:
+            return
+
+        key = (app['follow_up_date'], app['id'])
+        bisect.insort(self._followups, key)
+        if key not in self._queued and key not in self._reminded:
+            heapq.heappush(self._reminder_queue, key)
+            self._queued.add(key)
+
+    def _unindex_followup(self, app):
+        """Remove an application's follow-up from the schedule"""
+        if not app['follow_up_date'] or app['status'] in CLOSED_STATUSES:
+            return
+
+        key = (app['follow_up_date'], app['id'])
+        position = bisect.bisect_left(self._followups, key)
+        if position < len(self._followups) and self._followups[position] == key:
+            del self._followups[position]
+
+    def _expand_term(self, term):
+        """Postings lists of every indexed token starting with term"""
+        matches = []
+        position = bisect.bisect_left(self._vocabulary, term)
+        while position < len(self._vocabulary) and self._vocabulary[position].startswith(term):
+            matches.append(self._postings[self._vocabulary[position]])
+            position += 1
+        return matches
+
+    def _reserve_ids(self, count):
+        """Claim count new IDs for this process
+
+        The highest ID handed out by any process is kept in a small file next
+        to the database and bumped under the file lock, so IDs returned to
+        callers stay valid when another process saves first.
+        """
+        if count <= 0:
+            return
+        with self._lock, self._file_lock():
+            try:
+                with open(self.next_id_path, 'r') as f:
+                    start = int(f.read())
+            except (OSError, ValueError):
+                # No ID file yet: start after everything already saved
+                start = self._read_disk()[1]
+            start = max(start, self.next_id)
+
+            with open(self.next_id_path, 'w') as f:
+                f.write(str(start + count))
+                f.flush()
+                os.fsync(f.fileno())
+
+            self._reserved_ids.extend(range(start, start + count))
+            self.next_id = start + count
+
+    def _allocate_id(self):
+        """Hand out the next application ID; IDs are never reused
+
+        When adds are being grouped into one save (a batch or write-behind),
+        IDs are reserved flush_batch_size at a time so the ID file isn't
+        rewritten for every add. IDs left over when the process exits are
+        skipped.
+        """
+        with self._lock:
+            if not self._reserved_ids:
+                grouped = self._batch_depth or self.write_behind
+                self._reserve_ids(max(self.flush_batch_size, 1) if grouped else 1)
+            return self._reserved_ids.popleft()
+
+    def get_application(self, app_id):
+        """Get an application by ID, or None"""
+        return self._by_id.get(app_id)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
 
     def add_application(self, job_title, company, job_url, location="Sydney, Australia",
-                       status="Applied", date_applied=None, notes=""):
+                       status="Applied", date_applied=None, notes="", source=None):
         """Add new job application"""
+        app_id = self._insert_application(job_title, company, job_url, location, status, date_applied, notes,
+                                          source)
 
+        print(f"✅ Added application: {job_title} at {company}")
+        return app_id
+
+    def _insert_application(self, job_title, company, job_url, location="Sydney, Australia",
+                            status="Applied", date_applied=None, notes="", source=None):
+        """Append a new application record and return its ID"""
         if date_applied is None:
             date_applied = datetime.now().strftime('%Y-%m-%d')
 
         application = {
-            'id': len(self.applications) + 1,
+            'id': None,
             'job_title': job_title,
             'company': company,
             'location': location,
@@ -43,42 +559,151 @@ class ApplicationTracker:
             'notes': notes,
             'follow_up_date': None,
             'resume_version': None,
-            'cover_letter_version': None
+            'cover_letter_version': None,
+            'source': source
         }
 
-        self.applications.append(application)
-        self.save()
+        with self._lock:
+            application['id'] = self._allocate_id()
+            self.applications.append(application)
+            self._index(application)
+            self._record_event(application, 'created', status=status, source=source,
+                               platform=job_platform(job_url))
+            self._persist(application, new=True)
 
-        print(f"✅ Added application: {job_title} at {company}")
         return application['id']
 
+    def add_applications(self, applications):
+        """Add many applications with a single write
+
+        Each item is a dict of add_application keyword arguments. Returns one
+        result per item: {'success': True, 'id': ...} or
+        {'success': False, 'error': ...}.
+        """
+        applications = list(applications)
+        results = []
+        with self.batch():
+            self._reserve_ids(sum(1 for item in applications if not self._validate_application(item)))
+            for item in applications:
+                error = self._validate_application(item)
+                if error:
+                    results.append({'success': False, 'error': error})
+                else:
+                    results.append({'success': True, 'id': self._insert_application(**item)})
+
+        self._report_bulk('Added', 'applications', results)
+        return results
+
     def update_status(self, app_id, new_status, notes=""):
         """Update application status"""
-        for app in self.applications:
-            if app['id'] == app_id:
-                app['status'] = new_status
-                app['date_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                if notes:
-                    app['notes'] += f"\n{datetime.now().strftime('%Y-%m-%d')}: {notes}"
-                self.save()
-                print(f"✅ Updated #{app_id} to: {new_status}")
-                return True
+        app = self._by_id.get(app_id)
+        if app is not None:
+            self._apply_status(app, new_status, notes)
+            print(f"✅ Updated #{app_id} to: {new_status}")
+            return True
 
         print(f"❌ Application #{app_id} not found")
         return False
 
+    def _apply_status(self, app, new_status, notes=""):
+        """Set an application's status and persist the change"""
+        with self._lock:
+            self._unindex(app)
+            previous_status = app['status']
+            app['status'] = new_status
+            app['date_updated'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            self._record_event(app, 'status', status=new_status, previous_status=previous_status, note=notes)
+            self._index(app)
+            self._persist(app)
+
+    def update_statuses(self, updates):
+        """Update many application statuses with a single write
+
+        updates maps application ID to either a status string or a dict with
+        'status' and optional 'notes'. Returns {app_id: result} where each
+        result is {'success': True} or {'success': False, 'error': ...}.
+        """
+        results = {}
+        with self.batch():
+            for app_id, update in updates.items():
+                new_status, notes, error = self._parse_status_update(update)
+                if error is None and app_id not in self._by_id:
+                    error = f"Application #{app_id} not found"
+                if error:
+                    results[app_id] = {'success': False, 'error': error}
+                else:
+                    self._apply_status(self._by_id[app_id], new_status, notes)
+                    results[app_id] = {'success': True}
+
+        self._report_bulk('Updated', 'statuses', results.values())
+        return results
+
+    @staticmethod
+    def _validate_application(item):
+        """Return an error message for a bad add_applications item, or None"""
+        if not isinstance(item, dict):
+            return 'Application must be a dict'
+
+        unknown = sorted(set(item) - set(APPLICATION_FIELDS))
+        if unknown:
+            return f"Unknown fields: {', '.join(unknown)}"
+
+        missing = [field for field in REQUIRED_FIELDS if not item.get(field)]
+        if missing:
+            return f"Missing required fields: {', '.join(missing)}"
+
+        return None
+
+    @staticmethod
+    def _parse_status_update(update):
+        """Split an update_statuses value into (status, notes, error)"""
+        if isinstance(update, dict):
+            new_status, notes = update.get('status'), update.get('notes') or ''
+        else:
+            new_status, notes = update, ''
+
+        if not new_status or not isinstance(new_status, str):
+            return None, None, 'Status is required'
+
+        return new_status, notes, None
+
+    @staticmethod
+    def _report_bulk(action, noun, results):
+        """Print a one-line summary of a bulk operation"""
+        results = list(results)
+        failed = sum(1 for result in results if not result['success'])
+        message = f"✅ {action} {len(results) - failed} {noun}"
+        if failed:
+            message += f" (❌ {failed} failed)"
+        print(message)
+
     def add_follow_up(self, app_id, follow_up_date, notes=""):
         """Add follow-up reminder"""
-        for app in self.applications:
-            if app['id'] == app_id:
-                app['follow_up_date'] = follow_up_date
-                if notes:
-                    app['notes'] += f"\nFollow-up scheduled for {follow_up_date}: {notes}"
-                self.save()
-                print(f"✅ Follow-up added for #{app_id} on {follow_up_date}")
-                return True
+        app = self._by_id.get(app_id)
+        if app is None:
+            return False
 
-        return False
+        with self._lock:
+            self._unindex(app)
+            app['follow_up_date'] = follow_up_date
+            self._record_event(app, 'follow_up', follow_up_date=follow_up_date, note=notes)
+            self._index(app)
+            self._persist(app)
+        print(f"✅ Follow-up added for #{app_id} on {follow_up_date}")
+        return True
+
+    def add_note(self, app_id, note):
+        """Add a note to an application's history"""
+        app = self._by_id.get(app_id)
+        if app is None:
+            return False
+
+        with self._lock:
+            self._unindex_text(app)
+            self._record_event(app, 'note', note=note)
+            self._index_text(app)
+            self._persist(app)
+        return True
 
     def get_applications_by_status(self, status):
         """Get all applications with specific status"""
@@ -86,10 +711,55 @@ class ApplicationTracker:
 
     def get_pending_followups(self):
         """Get applications needing follow-up"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        pending = [app for app in self.applications
-                  if app['follow_up_date'] and app['follow_up_date'] <= today]
-        return pending
+        return self.due_before()
+
+    def due_before(self, date=None):
+        """Open applications with a follow-up due on or before date (default today), soonest first"""
+        with self._lock:
+            end = bisect.bisect_right(self._followups, (_date_key(date), float('inf')))
+            return [self._by_id[app_id] for _, app_id in self._followups[:end]]
+
+    def due_within(self, days):
+        """Open applications with a follow-up due in the next days days (or overdue)"""
+        return self.due_before(datetime.now() + timedelta(days=days))
+
+    def next_n(self, k):
+        """The k open applications with the soonest follow-ups"""
+        with self._lock:
+            return [self._by_id[app_id] for _, app_id in self._followups[:k]]
+
+    def add_reminder_hook(self, callback):
+        """Call callback(app) from dispatch_due_reminders when a follow-up falls due"""
+        self.reminder_hooks.append(callback)
+
+    def dispatch_due_reminders(self, date=None):
+        """Run the reminder hooks for follow-ups that have fallen due
+
+        Each follow-up is dispatched once per process. Cheap enough to poll:
+        when nothing is due this only looks at the top of a heap. Returns the
+        applications dispatched.
+        """
+        today = _date_key(date)
+        due = []
+        with self._lock:
+            while self._reminder_queue and self._reminder_queue[0][0] <= today:
+                key = heapq.heappop(self._reminder_queue)
+                self._queued.discard(key)
+
+                # Skip entries made stale by a later status or date change
+                follow_up_date, app_id = key
+                app = self._by_id.get(app_id)
+                if (app is None or app['follow_up_date'] != follow_up_date or
+                        app['status'] in CLOSED_STATUSES or key in self._reminded):
+                    continue
+
+                self._reminded.add(key)
+                due.append(app)
+
+        for app in due:
+            for callback in self.reminder_hooks:
+                callback(app)
+        return due
 
     def get_statistics(self):
         """Get application statistics"""
@@ -101,32 +771,71 @@ class ApplicationTracker:
                 'response_rate': 0
             }
 
-        df = pd.DataFrame(self.applications)
+        # Served from counters kept current on every mutation
+        today = datetime.now()
+        recent = sum(self._daily_counts[(today - timedelta(days=days)).strftime('%Y-%m-%d')]
+                     for days in range(8))
 
+        total = len(self.applications)
         stats = {
-            'total': len(self.applications),
-            'by_status': df['status'].value_counts().to_dict(),
-            'by_company': df['company'].value_counts().to_dict(),
-            'recent_applications': len(df[df['date_applied'] >=
-                (datetime.now() - pd.Timedelta(days=7)).strftime('%Y-%m-%d')]),
+            'total': total,
+            'by_status': dict(self._status_counts.most_common()),
+            'by_company': dict(self._company_counts.most_common()),
+            'recent_applications': recent,
+            'response_rate': self._responded / total * 100
         }
 
-        # Calculate response rate
-        responded = len(df[df['status'].isin(['Interview Scheduled', 'Offer', 'Rejected'])])
-        stats['response_rate'] = (responded / len(df) * 100) if len(df) > 0 else 0
-
         return stats
 
-    def search_applications(self, keyword):
-        """Search applications by keyword"""
-        keyword_lower = keyword.lower()
-        results = [
-            app for app in self.applications
-            if keyword_lower in app['job_title'].lower() or
-               keyword_lower in app['company'].lower() or
-               keyword_lower in app.get('notes', '').lower()
-        ]
-        return results
+    def search_applications(self, keyword, limit=None):
+        """Search applications by keyword
+
+        Every word of the keyword must match the start of a word in the job
+        title, company, notes or the notes in its history. Results are ranked
+        by relevance: title matches count most, then company, then notes, and
+        rare words count more than common ones. Pass limit to get only the
+        best matches.
+        """
+        terms = sorted(set(tokenize(keyword)))
+        if not terms:
+            return list(self.applications[:limit])
+
+        with self._lock:
+            if self._postings is None:
+                self._build_search_index()
+
+            total = len(self.applications)
+            expanded = []
+            for term in terms:
+                postings = self._expand_term(term)
+                if not postings:
+                    return []
+                weighted = [(p, math.log(1 + total / len(p))) for p in postings]
+                expanded.append((sum(len(p) for p in postings), weighted))
+
+            # Start from the most selective term and narrow down
+            expanded.sort(key=lambda item: item[0])
+            scores = {}
+            for postings, idf in expanded[0][1]:
+                for app_id, weight in postings.items():
+                    scores[app_id] = scores.get(app_id, 0) + weight * idf
+
+            for _, weighted in expanded[1:]:
+                narrowed = {}
+                for app_id, score in scores.items():
+                    term_score = sum(p[app_id] * idf for p, idf in weighted if app_id in p)
+                    if term_score:
+                        narrowed[app_id] = score + term_score
+                scores = narrowed
+                if not scores:
+                    return []
+
+            rank = lambda app_id: (-scores[app_id], app_id)
+            if limit is None:
+                ranked = sorted(scores, key=rank)
+            else:
+                ranked = heapq.nsmallest(limit, scores, key=rank)
+            return [self._by_id[app_id] for app_id in ranked]
 
     def export_to_csv(self, filename=None):
         """Export applications to CSV"""
@@ -135,16 +844,153 @@ class ApplicationTracker:
             filename = os.path.join(base_dir, 'applications.csv')
         """Export applications to CSV"""
         if self.applications:
+            import pandas as pd
             df = pd.DataFrame(self.applications)
             df.to_csv(filename, index=False)
             print(f"✅ Exported to {filename}")
         else:
             print("⚠️  No applications to export")
 
+    def export_to_parquet(self, filename=None):
+        """Export applications to Parquet, or Arrow IPC for .arrow/.feather files
+
+        Dates keep their types, and rows are written in batches.
+        """
+        from columnar_io import write_records, APPLICATION_SCHEMA
+
+        if filename is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            filename = os.path.join(base_dir, 'applications.parquet')
+
+        count = write_records(self._iter_applications(), filename, APPLICATION_SCHEMA)
+        print(f"✅ Exported {count} applications to {filename}")
+        return count
+
+    def _iter_applications(self):
+        """Snapshot of the applications for export"""
+        with self._lock:
+            return iter(list(self.applications))
+
+    def import_from_parquet(self, filename):
+        """Add the applications from a Parquet or Arrow IPC export
+
+        Imported applications get new IDs; every other field is kept.
+        Records are streamed from the file, and the IDs for all of them are
+        reserved up front from the row count in the file's metadata.
+        """
+        from columnar_io import iter_records, count_records
+
+        count = 0
+        with self.batch():
+            self._reserve_ids(count_records(filename))
+            for record in iter_records(filename):
+                self._import_application(record)
+                count += 1
+
+        print(f"✅ Imported {count} applications from {filename}")
+        return count
+
+    def _import_application(self, record):
+        """Append an exported application record under a new ID"""
+        application = dict(record)
+        application['notes'] = application.get('notes') or ''
+
+        with self._lock:
+            application['id'] = self._allocate_id()
+            self.applications.append(application)
+            self._index(application)
+            self._record_event(application, 'created', status=application['status'],
+                               source=application.get('source'), platform=job_platform(application.get('job_url')))
+            self._persist(application, new=True)
+
     def save(self):
-        """Save applications to JSON"""
-        with open(self.db_path, 'w') as f:
-            json.dump(self.applications, f, indent=2)
+        """Save applications to JSON
+
+        Writes to a temporary file in the same directory, fsyncs it and
+        renames it over the database, so a crash never leaves a partial file.
+        Saves from different processes are serialized with a file lock; if
+        another process saved since we last read, its changes are merged in
+        first instead of being overwritten.
+        """
+        with self._lock, self._file_lock() as lock_file:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            if self._changed_on_disk(lock_file):
+                self._merge_from_disk()
+
+            # History first, so a crash never leaves a state change unlogged
+            if self._pending_events:
+                self._append_events(self._pending_events)
+                self._pending_events = []
+                self._pending_notes = {}
+                # Move the saved notes over to the loaded history
+                if self._events is not None:
+                    self._load_events()
+
+            data = {'version': self.version + 1, 'next_id': self.next_id, 'applications': self.applications}
+
+            db_dir = os.path.dirname(os.path.abspath(self.db_path))
+            fd, tmp_path = tempfile.mkstemp(dir=db_dir, prefix='.applications-', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    stamp = _file_stamp(os.fstat(f.fileno()))
+                os.replace(tmp_path, self.db_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+            self.version = data['version']
+            self._disk_stamp = stamp
+            if lock_file is not None:
+                lock_file.seek(0)
+                lock_file.truncate()
+                lock_file.write(str(self.version))
+                lock_file.flush()
+            self._pending = 0
+            self._dirty_ids.clear()
+            self._new_apps.clear()
+
+    def flush(self):
+        """Write out pending changes, if there are any"""
+        with self._lock:
+            if self._pending:
+                self.save()
+
+    def _persist(self, app, new=False):
+        """Record a mutation and save it now or on the write-behind schedule"""
+        with self._lock:
+            if new:
+                self._new_apps.append(app)
+            else:
+                self._dirty_ids.add(app['id'])
+            self._pending += 1
+            if self._batch_depth:
+                return
+
+            if not self.write_behind or self._pending >= self.flush_batch_size:
+                self.save()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    @contextmanager
+    def batch(self):
+        """Defer all writes inside the block and flush once at the end"""
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if not self._batch_depth:
+                    self.flush()
 
     def display_dashboard(self):
         """Display application dashboard"""
@@ -202,6 +1048,9 @@ class ApplicationTracker:
             print(f"   URL: {app['job_url']}")
             if app['notes']:
                 print(f"   Notes: {app['notes'][:100]}...")
+            history = [event for event in self.get_history(app['id']) if event.get('note')]
+            if history:
+                print(f"   Latest note ({history[-1]['at'][:10]}): {history[-1]['note'][:100]}")
             print()
 
 
@@ -244,8 +1093,11 @@ def main():
     print("   tracker.add_application(title, company, url)")
     print("   tracker.update_status(app_id, 'Interview Scheduled')")
     print("   tracker.add_follow_up(app_id, '2025-10-15')")
+    print("   tracker.get_history(app_id)")
+    print("   tracker.due_within(7)")
     print("   tracker.search_applications('data scientist')")
     print("   tracker.export_to_csv()")
+    print("   tracker.export_to_parquet()")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,208 @@
+"""
+Columnar I/O
+Parquet and Arrow IPC export/import for applications and scraped jobs
+"""
+
+import os
+from datetime import date, datetime
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Arrow IPC files are left uncompressed by default so they can be memory
+# mapped without copying; Parquet is always decoded, so compress it
+IPC_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+DEFAULT_PARQUET_COMPRESSION = 'zstd'
+
+DEFAULT_BATCH_SIZE = 10000
+
+if pa is not None:
+    APPLICATION_SCHEMA = pa.schema([
+        ('id', pa.int64()),
+        ('job_title', pa.string()),
+        ('company', pa.string()),
+        ('location', pa.string()),
+        ('job_url', pa.string()),
+        ('status', pa.string()),
+        ('date_applied', pa.date32()),
+        ('date_updated', pa.timestamp('s')),
+        ('notes', pa.string()),
+        ('follow_up_date', pa.date32()),
+        ('resume_version', pa.string()),
+        ('cover_letter_version', pa.string()),
+        ('source', pa.string()),
+    ])
+
+    JOB_SCHEMA = pa.schema([
+        ('title', pa.string()),
+        ('company', pa.string()),
+        ('location', pa.string()),
+        ('url', pa.string()),
+        ('source', pa.string()),
+        ('date_scraped', pa.timestamp('s')),
+        ('applied', pa.bool_()),
+        ('description', pa.string()),
+        ('status', pa.string()),
+        ('skill_match', pa.string()),
+        ('matched_skills', pa.list_(pa.string())),
+        ('priority_score', pa.float64()),
+    ])
+else:
+    APPLICATION_SCHEMA = JOB_SCHEMA = None
+
+
+def _check_pyarrow():
+    """Make sure pyarrow is installed"""
+    if pa is None:
+        raise ImportError("Parquet/Arrow export requires pyarrow: pip install pyarrow")
+
+
+def _is_ipc(path):
+    """Whether a path names an Arrow IPC file rather than Parquet"""
+    return os.path.splitext(path)[1].lower() in IPC_EXTENSIONS
+
+
+def _to_date(value):
+    """'YYYY-MM-DD...' string to date; unparseable values become None"""
+    if value is None or isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _to_timestamp(value):
+    """'YYYY-MM-DD HH:MM:SS' string to datetime; unparseable values become None"""
+    if value is None or isinstance(value, datetime):
+        return value
+    try:
+        return datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _to_list(value):
+    """Wrap a single value as a list of strings"""
+    if value is None or isinstance(value, list):
+        return value
+    return list(value) if isinstance(value, (tuple, set)) else [value]
+
+
+def _converters(schema):
+    """Per-field functions turning JSON-style values into Arrow-ready ones"""
+    converters = {}
+    for field in schema:
+        if pa.types.is_date(field.type):
+            converters[field.name] = _to_date
+        elif pa.types.is_timestamp(field.type):
+            converters[field.name] = _to_timestamp
+        elif pa.types.is_list(field.type):
+            converters[field.name] = _to_list
+    return converters
+
+
+def _record_batches(records, schema, batch_size):
+    """Group records into typed record batches without materializing them all"""
+    converters = _converters(schema)
+    names = schema.names
+
+    rows = []
+    for record in records:
+        row = {}
+        for name in names:
+            value = record.get(name)
+            convert = converters.get(name)
+            row[name] = convert(value) if convert else value
+        rows.append(row)
+
+        if len(rows) >= batch_size:
+            yield pa.RecordBatch.from_pylist(rows, schema=schema)
+            rows = []
+
+    if rows:
+        yield pa.RecordBatch.from_pylist(rows, schema=schema)
+
+
+def write_records(records, path, schema, batch_size=DEFAULT_BATCH_SIZE, compression=None):
+    """Stream records (an iterable of dicts) to Parquet or Arrow IPC
+
+    The format follows the extension: .arrow/.feather/.ipc for Arrow IPC,
+    anything else for Parquet. Fields missing from the schema are dropped.
+    Only one batch is held in memory at a time. Returns the row count.
+    """
+    _check_pyarrow()
+
+    count = 0
+    if _is_ipc(path):
+        options = pa.ipc.IpcWriteOptions(compression=compression)
+        with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, schema, options=options) as writer:
+            for batch in _record_batches(records, schema, batch_size):
+                writer.write_batch(batch)
+                count += batch.num_rows
+    else:
+        with pq.ParquetWriter(path, schema, compression=compression or DEFAULT_PARQUET_COMPRESSION) as writer:
+            for batch in _record_batches(records, schema, batch_size):
+                writer.write_batch(batch)
+                count += batch.num_rows
+
+    return count
+
+
+def read_table(path, columns=None):
+    """Load a Parquet or Arrow IPC file as a pyarrow Table, memory mapped
+
+    Uncompressed Arrow IPC files are mapped without copying, so large files
+    can be queried (or turned into pandas with table.to_pandas()) without
+    reading them into memory first.
+    """
+    _check_pyarrow()
+
+    if _is_ipc(path):
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        return table.select(columns) if columns else table
+
+    return pq.read_table(path, columns=columns, memory_map=True)
+
+
+def count_records(path):
+    """Row count of a Parquet or Arrow IPC file, read from its metadata"""
+    _check_pyarrow()
+
+    if _is_ipc(path):
+        reader = pa.ipc.open_file(pa.memory_map(path, 'r'))
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+    return pq.ParquetFile(path, memory_map=True).metadata.num_rows
+
+
+def _from_arrow(value):
+    """Turn Arrow dates and timestamps back into the strings the app stores"""
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, date):
+        return value.strftime('%Y-%m-%d')
+    return value
+
+
+def iter_records(path, batch_size=DEFAULT_BATCH_SIZE, drop_nulls=False):
+    """Stream a Parquet or Arrow IPC file back as dicts, one batch at a time
+
+    With drop_nulls=True, null fields are left out of each dict, which
+    restores records that never had those keys (like most scraped jobs).
+    """
+    _check_pyarrow()
+
+    if _is_ipc(path):
+        reader = pa.ipc.open_file(pa.memory_map(path, 'r'))
+        batches = (reader.get_batch(i) for i in range(reader.num_record_batches))
+    else:
+        batches = pq.ParquetFile(path, memory_map=True).iter_batches(batch_size=batch_size)
+
+    for batch in batches:
+        for row in batch.to_pylist():
+            yield {key: _from_arrow(value) for key, value in row.items()
+                   if not (drop_nulls and value is None)}
@@ -8,6 +8,7 @@ from job_scraper import JobScraper
 from resume_tailor import ResumeTailor
 from cover_letter_generator import CoverLetterGenerator
 from application_tracker import ApplicationTracker
+from document_renderer import render_documents
 import time
 import os
 import json
@@ -124,85 +125,108 @@ class ComprehensiveJobSearch:
         output_dir = '/Users/ABRAHAM/job_application_system/applications_comprehensive'
         os.makedirs(output_dir, exist_ok=True)
 
-        for i, job in enumerate(self.all_jobs, 1):
-            print(f"\n[{i}/{len(self.all_jobs)}] {job['title']} at {job['company']}")
-            print("-" * 80)
-
-            # Create company folder
-            company_folder = os.path.join(output_dir,
-                f"{job['company'].replace('/', '_').replace('|', '_')}_{i}")
-            os.makedirs(company_folder, exist_ok=True)
-
-            # Create job-specific description
-            job_desc = self._create_job_description(job)
-
-            try:
-                # Tailor resume
-                print("  🎯 Tailoring resume...")
-                tailored_resume = self.tailor.generate_tailored_resume(
-                    job_description=job_desc,
-                    job_title=job['title'],
-                    company_name=job['company'],
-                    output_format='text'
-                )
-
-                # Move tailored files
-                latest_resume = max(glob.glob('/Users/ABRAHAM/job_application_system/tailored_resume_*.txt'),
-                                   key=os.path.getctime)
-                os.rename(latest_resume,
-                         os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.txt"))
-
-                latest_resume_json = max(glob.glob('/Users/ABRAHAM/job_application_system/tailored_resume_*.json'),
-                                        key=os.path.getctime)
-                os.rename(latest_resume_json,
-                         os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.json"))
-
-                # Generate cover letter
-                print("  ✍️  Generating cover letter...")
-                cover_letter = self.cover_gen.generate_cover_letter(
-                    job_description=job_desc,
-                    job_title=job['title'],
-                    company_name=job['company']
-                )
-
-                # Move cover letter
-                latest_cover = max(glob.glob('/Users/ABRAHAM/job_application_system/cover_letter_*.txt'),
-                                  key=os.path.getctime)
-                os.rename(latest_cover,
-                         os.path.join(company_folder, f"cover_letter_{job['company'].replace('/', '_')}.txt"))
-
-                # Create application info
-                app_info = {
-                    'job_title': job['title'],
-                    'company': job['company'],
-                    'location': job['location'],
-                    'url': job['url'],
-                    'source': job['source'],
-                    'skill_match': f"{tailored_resume['skill_match_analysis']['match_percentage']:.1f}%",
-                    'matched_skills': tailored_resume['skill_match_analysis']['matched'],
-                    'status': 'Ready to Apply'
-                }
-
-                with open(os.path.join(company_folder, 'application_info.json'), 'w') as f:
-                    json.dump(app_info, f, indent=2)
-
-                # Track in system
-                self.tracker.add_application(
-                    job_title=job['title'],
-                    company=job['company'],
-                    job_url=job['url'],
-                    location=job['location'],
-                    status='Prepared',
-                    notes=f"Skill match: {tailored_resume['skill_match_analysis']['match_percentage']:.1f}%. Source: {job['source']}"
-                )
-
-                print(f"  ✅ Complete!")
-
-            except Exception as e:
-                print(f"  ❌ Error: {e}")
-                continue
-
-            time.sleep(0.3)
+        # PDFs are rendered together at the end so the work spreads across cores
+        render_tasks = []
+
+        # One tracker write for the whole batch
+        with self.tracker.batch():
+            for i, job in enumerate(self.all_jobs, 1):
+                print(f"\n[{i}/{len(self.all_jobs)}] {job['title']} at {job['company']}")
+                print("-" * 80)
+
+                # Create company folder
+                company_folder = os.path.join(output_dir,
+                    f"{job['company'].replace('/', '_').replace('|', '_')}_{i}")
+                os.makedirs(company_folder, exist_ok=True)
+
+                # Create job-specific description
+                job_desc = self._create_job_description(job)
+
+                try:
+                    # Tailor resume
+                    print("  🎯 Tailoring resume...")
+                    tailored_resume = self.tailor.generate_tailored_resume(
+                        job_description=job_desc,
+                        job_title=job['title'],
+                        company_name=job['company'],
+                        output_format='text'
+                    )
+
+                    # Move tailored files
+                    latest_resume = max(glob.glob('/Users/ABRAHAM/job_application_system/tailored_resume_*.txt'),
+                                       key=os.path.getctime)
+                    os.rename(latest_resume,
+                             os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.txt"))
+
+                    latest_resume_json = max(glob.glob('/Users/ABRAHAM/job_application_system/tailored_resume_*.json'),
+                                            key=os.path.getctime)
+                    os.rename(latest_resume_json,
+                             os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.json"))
+
+                    # Generate cover letter
+                    print("  ✍️  Generating cover letter...")
+                    cover_letter = self.cover_gen.generate_cover_letter(
+                        job_description=job_desc,
+                        job_title=job['title'],
+                        company_name=job['company']
+                    )
+
+                    # Move cover letter
+                    latest_cover = max(glob.glob('/Users/ABRAHAM/job_application_system/cover_letter_*.txt'),
+                                      key=os.path.getctime)
+                    os.rename(latest_cover,
+                             os.path.join(company_folder, f"cover_letter_{job['company'].replace('/', '_')}.txt"))
+
+                    # Create application info
+                    app_info = {
+                        'job_title': job['title'],
+                        'company': job['company'],
+                        'location': job['location'],
+                        'url': job['url'],
+                        'source': job['source'],
+                        'skill_match': f"{tailored_resume['skill_match_analysis']['match_percentage']:.1f}%",
+                        'matched_skills': tailored_resume['skill_match_analysis']['matched'],
+                        'status': 'Ready to Apply'
+                    }
+
+                    with open(os.path.join(company_folder, 'application_info.json'), 'w') as f:
+                        json.dump(app_info, f, indent=2)
+
+                    clean_company = job['company'].replace('/', '_')
+                    render_tasks.append(('resume', 'pdf', tailored_resume,
+                                         os.path.join(company_folder, f"resume_{clean_company}.pdf")))
+                    render_tasks.append(('cover_letter', 'pdf', cover_letter,
+                                         os.path.join(company_folder, f"cover_letter_{clean_company}.pdf")))
+
+                    # Track in system
+                    self.tracker.add_application(
+                        job_title=job['title'],
+                        company=job['company'],
+                        job_url=job['url'],
+                        location=job['location'],
+                        status='Prepared',
+                        source=job['source'],
+                        notes=f"Skill match: {tailored_resume['skill_match_analysis']['match_percentage']:.1f}%. Source: {job['source']}"
+                    )
+
+                    print(f"  ✅ Complete!")
+
+                except Exception as e:
+                    print(f"  ❌ Error: {e}")
+                    continue
+
+                time.sleep(0.3)
+
+        # Render PDFs for upload
+        print(f"\n📄 Rendering {len(render_tasks)} PDF documents...")
+        try:
+            results = render_documents(render_tasks)
+            failed = [(path, error) for path, error in results if error]
+            for path, error in failed:
+                print(f"  ❌ {os.path.basename(path)}: {error}")
+            print(f"  ✅ Rendered {len(results) - len(failed)} PDFs")
+        except ImportError as e:
+            print(f"  ⚠️  Skipping PDF rendering: {e}")
 
         print("\n" + "="*80)
         print("🎉 ALL APPLICATIONS PREPARED!")
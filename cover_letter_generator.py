@@ -7,6 +7,27 @@ import json
 from datetime import datetime
 import re
 import os
+import numpy as np
+
+# Terms that make work experience or a project relevant to a job
+EXPERIENCE_TERMS = ['ml', 'machine learning', 'data', 'python', 'model', 'dashboard']
+PROJECT_TERMS = ['ml', 'machine learning', 'data', 'python', 'model', 'accuracy']
+
+# Requirement indicators, combined into one alternation so the description is
+# scanned once. Each branch captures the rest of the line after the indicator.
+REQUIREMENT_PATTERN = re.compile(
+    r'(?:requirement|require|must have|essential)[s]?:?\s*(.+)'
+    r'|(?:experience with|proficiency in|knowledge of)\s+(.+)'
+    r'|(?:strong|excellent|solid)\s+(?:understanding|knowledge|experience)\s+(?:of|in|with)\s+(.+)',
+    re.MULTILINE
+)
+
+# Letter styles as (opening template, closing template) indexes
+LETTER_STYLES = {
+    'innovation': (0, 0),
+    'technical': (1, 2),
+    'results': (2, 1),
+}
 
 class CoverLetterGenerator:
     def __init__(self, resume_data_path=None):
@@ -18,63 +39,106 @@ class CoverLetterGenerator:
         with open(resume_data_path, 'r') as f:
             self.data = json.load(f)
 
-    def extract_key_requirements(self, job_description):
-        """Extract key requirements from job description"""
-        # Common requirement indicators
-        requirement_patterns = [
-            r'(?:require|requirement|must have|essential)[s]?:?\s*(.+)',
-            r'(?:experience with|proficiency in|knowledge of)\s+(.+)',
-            r'(?:strong|excellent|solid)\s+(?:understanding|knowledge|experience)\s+(?:of|in|with)\s+(.+)'
-        ]
-
-        requirements = []
-        for pattern in requirement_patterns:
-            matches = re.findall(pattern, job_description.lower(), re.MULTILINE)
-            requirements.extend(matches)
+        # Your skills, keyed by lowercase name, matched as whole words
+        self.skill_names = {}
+        for skills in self.data.get('skills', {}).values():
+            if isinstance(skills, list):
+                self.skill_names.update((s.lower(), s) for s in skills)
+        self.skill_pattern = None
+        if self.skill_names:
+            alternatives = '|'.join(re.escape(s) for s in sorted(self.skill_names, key=len, reverse=True))
+            self.skill_pattern = re.compile(rf'(?<![\w+#])(?:{alternatives})(?![\w+#])')
+
+        self._build_relevance_vectors()
+
+    def _build_relevance_vectors(self):
+        """Precompute a term vector for every experience and project
+
+        Row i of relevance_matrix marks which relevance terms appear in
+        candidate i, so scoring a job is a dot product with the job's own
+        term vector.
+        """
+        self.relevance_terms = list(dict.fromkeys(EXPERIENCE_TERMS + PROJECT_TERMS))
+        self.relevance_candidates = []
+        rows = []
 
-        return requirements[:5]  # Top 5 requirements
-
-    def match_experience_to_requirements(self, job_description):
-        """Find relevant experience matching job requirements"""
-        job_lower = job_description.lower()
-
-        matched_experiences = []
-
-        # Check work experience
         for exp in self.data['experience']:
             exp_text = ' '.join(exp['achievements']).lower()
-            relevance_score = sum(1 for word in ['ml', 'machine learning', 'data', 'python', 'model', 'dashboard']
-                                 if word in exp_text and word in job_lower)
-
-            if relevance_score > 0:
-                matched_experiences.append({
-                    'type': 'work',
-                    'title': exp['title'],
-                    'company': exp['company'],
-                    'achievement': exp['achievements'][0],  # Best achievement
-                    'score': relevance_score
-                })
-
-        # Check projects
+            rows.append([term in EXPERIENCE_TERMS and term in exp_text for term in self.relevance_terms])
+            self.relevance_candidates.append({
+                'type': 'work',
+                'title': exp['title'],
+                'company': exp['company'],
+                'achievement': exp['achievements'][0] if exp['achievements'] else ''  # Best achievement
+            })
+
         for proj in self.data['projects']:
             proj_text = (proj['description'] + ' ' + ' '.join(proj.get('achievements', []))).lower()
-            relevance_score = sum(1 for word in ['ml', 'machine learning', 'data', 'python', 'model', 'accuracy']
-                                 if word in proj_text and word in job_lower)
-
-            if relevance_score > 0:
-                matched_experiences.append({
-                    'type': 'project',
-                    'name': proj['name'],
-                    'achievement': proj.get('achievements', [proj['description']])[0],
-                    'score': relevance_score
-                })
+            rows.append([term in PROJECT_TERMS and term in proj_text for term in self.relevance_terms])
+            self.relevance_candidates.append({
+                'type': 'project',
+                'name': proj['name'],
+                'achievement': (proj.get('achievements') or [proj['description']])[0]
+            })
+
+        self.relevance_matrix = np.array(rows, dtype=np.int32).reshape(len(rows), len(self.relevance_terms))
+
+    def score_descriptions(self, job_descriptions):
+        """Score every experience and project against many job descriptions
+
+        Returns an array of shape (descriptions, candidates) where each entry
+        counts the relevance terms shared by the job and the candidate.
+        """
+        job_vectors = np.array(
+            [[term in text for term in self.relevance_terms]
+             for text in (description.lower() for description in job_descriptions)],
+            dtype=np.int32
+        ).reshape(-1, len(self.relevance_terms))
+
+        return job_vectors @ self.relevance_matrix.T
+
+    def _top_matches(self, scores, limit=3):
+        """Turn one row of candidate scores into the top matched experiences"""
+        matched_experiences = [
+            dict(candidate, score=int(score))
+            for candidate, score in zip(self.relevance_candidates, scores)
+            if score > 0
+        ]
 
         # Sort by relevance
         matched_experiences.sort(key=lambda x: x['score'], reverse=True)
 
-        return matched_experiences[:3]  # Top 3 most relevant
+        return matched_experiences[:limit]
+
+    def extract_key_requirements(self, job_description, limit=5):
+        """Extract key requirements from job description
+
+        Returns up to `limit` dicts with the requirement text and the IDs
+        (lowercase names) of your skills it mentions.
+        """
+        text = job_description.lower()
+
+        requirements = []
+        for match in REQUIREMENT_PATTERN.finditer(text):
+            requirement = (match.group(1) or match.group(2) or match.group(3)).strip(' -*•\t')
+            skills = []
+            if self.skill_pattern:
+                skills = list(dict.fromkeys(self.skill_pattern.findall(requirement)))
+            requirements.append({'requirement': requirement, 'skills': skills})
+            if len(requirements) >= limit:
+                break
+
+        return requirements
+
+    def match_experience_to_requirements(self, job_description):
+        """Find relevant experience matching job requirements"""
+        return self._top_matches(self.score_descriptions([job_description])[0])  # Top 3 most relevant
+
+    def match_experience_batch(self, job_descriptions):
+        """Find relevant experience for many job descriptions in one pass"""
+        return [self._top_matches(scores) for scores in self.score_descriptions(job_descriptions)]
 
-    def generate_opening_paragraph(self, job_title, company_name):
+    def generate_opening_paragraph(self, job_title, company_name, variant=0):
         """Generate opening paragraph"""
         templates = [
             f"I am writing to express my strong interest in the {job_title} position at {company_name}. As a dynamic Computer Science graduate specializing in AI and Data Science, currently pursuing my Master's at the University of Sydney, I am excited about the opportunity to contribute to your data-driven initiatives.",
@@ -84,9 +148,9 @@ class CoverLetterGenerator:
             f"I am excited to apply for the {job_title} position at {company_name}. Having successfully delivered machine learning solutions that improved efficiency by up to 40% in my previous role, I am confident in my ability to drive similar impactful results for your team."
         ]
 
-        return templates[0]  # Use first template
+        return templates[variant]
 
-    def generate_body_paragraphs(self, matched_experiences, job_title):
+    def generate_body_paragraphs(self, matched_experiences, job_title, requirements=None):
         """Generate body paragraphs highlighting relevant experience"""
         paragraphs = []
 
@@ -109,11 +173,23 @@ class CoverLetterGenerator:
 
         # Paragraph about skills and tools
         skills_paragraph = f"I bring proficiency in key technologies including Python, TensorFlow, PyTorch, and scikit-learn, along with strong data visualization skills using Tableau and Power BI. My AWS certification and experience with cloud platforms enable me to deploy scalable ML solutions in production environments."
+
+        # Call out the skills the posting explicitly asks for
+        required_skills = list(dict.fromkeys(
+            self.skill_names.get(skill, skill) for req in (requirements or []) for skill in req['skills']
+        ))
+        if required_skills:
+            if len(required_skills) > 1:
+                skill_list = ', '.join(required_skills[:-1]) + f" and {required_skills[-1]}"
+            else:
+                skill_list = required_skills[0]
+            skills_paragraph += f" I note your emphasis on {skill_list}, which I have used extensively in my own work."
+
         paragraphs.append(skills_paragraph)
 
         return paragraphs
 
-    def generate_closing_paragraph(self, company_name):
+    def generate_closing_paragraph(self, company_name, variant=0):
         """Generate closing paragraph"""
         templates = [
             f"I am particularly drawn to {company_name} because of your commitment to innovation and data-driven decision making. I am eager to contribute my technical skills, analytical mindset, and collaborative approach to your team. I would welcome the opportunity to discuss how my background and enthusiasm can benefit your organization.",
@@ -123,15 +199,14 @@ class CoverLetterGenerator:
             f"Thank you for considering my application. I am enthusiastic about the opportunity to contribute to {company_name}'s success and would welcome the chance to discuss how my skills and experience align with your needs. I look forward to hearing from you."
         ]
 
-        return templates[0]
+        return templates[variant]
 
-    def generate_cover_letter(self, job_description, job_title, company_name, hiring_manager="Hiring Manager"):
-        """Generate complete cover letter"""
-
-        # Extract matched experiences
+    def _prepare_letter(self, job_description, job_title, hiring_manager):
+        """Run the job analysis and build the parts every letter style shares"""
+        # Extract matched experiences and stated requirements
         matched_exp = self.match_experience_to_requirements(job_description)
+        requirements = self.extract_key_requirements(job_description)
 
-        # Build cover letter
         personal = self.data['personal_info']
 
         # Header
@@ -145,44 +220,74 @@ class CoverLetterGenerator:
         recipient = f"{today}\n\n"
         recipient += f"Dear {hiring_manager},\n\n"
 
-        # Opening
-        opening = self.generate_opening_paragraph(job_title, company_name) + "\n\n"
-
         # Body
-        body_paragraphs = self.generate_body_paragraphs(matched_exp, job_title)
+        body_paragraphs = self.generate_body_paragraphs(matched_exp, job_title, requirements)
         body = "\n\n".join(body_paragraphs) + "\n\n"
 
-        # Closing
-        closing = self.generate_closing_paragraph(company_name) + "\n\n"
-        closing += f"Sincerely,\n{personal['name']}"
+        return {
+            'header': header + recipient,
+            'body': body,
+            'signature': f"Sincerely,\n{personal['name']}"
+        }
+
+    def _render_letter(self, shared, job_title, company_name, style):
+        """Assemble a letter in the given style from the shared parts"""
+        opening_variant, closing_variant = LETTER_STYLES[style]
 
-        # Combine all parts
-        cover_letter = header + recipient + opening + body + closing
+        opening = self.generate_opening_paragraph(job_title, company_name, opening_variant) + "\n\n"
+        closing = self.generate_closing_paragraph(company_name, closing_variant) + "\n\n"
 
-        # Save to file
+        return shared['header'] + opening + shared['body'] + closing + shared['signature']
+
+    def _save_cover_letter(self, cover_letter, company_name, style=None):
+        """Write a cover letter next to this module and return the filename"""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         # Clean company name for filename
         clean_company = company_name.replace(' ', '_').replace('/', '_').replace('|', '_')
+        suffix = f"_{style}" if style else ""
         base_dir = os.path.dirname(os.path.abspath(__file__))
-        filename = os.path.join(base_dir, f"cover_letter_{clean_company}_{timestamp}.txt")
+        filename = os.path.join(base_dir, f"cover_letter_{clean_company}{suffix}_{timestamp}.txt")
 
         with open(filename, 'w') as f:
             f.write(cover_letter)
 
         print(f"\n✅ Cover letter generated: {filename}")
 
+        return filename
+
+    def generate_cover_letter(self, job_description, job_title, company_name, hiring_manager="Hiring Manager",
+                              style='innovation'):
+        """Generate complete cover letter"""
+        shared = self._prepare_letter(job_description, job_title, hiring_manager)
+        cover_letter = self._render_letter(shared, job_title, company_name, style)
+
+        self._save_cover_letter(cover_letter, company_name)
+
         return cover_letter
 
-    def generate_multiple_versions(self, job_description, job_title, company_name):
-        """Generate multiple cover letter versions"""
-        versions = []
+    def generate_multiple_versions(self, job_description, job_title, company_name, hiring_manager="Hiring Manager",
+                                   styles=None, save=False):
+        """Generate multiple cover letter versions
+
+        The job is analyzed once and every style is rendered from that shared
+        state. Returns a list of (style, cover_letter); files are only written
+        when save is True.
+        """
+        if styles is None:
+            styles = list(LETTER_STYLES)
 
-        # Version 1: Technical focus
-        cl1 = self.generate_cover_letter(job_description, job_title, company_name)
-        versions.append(('technical', cl1))
+        unknown = [style for style in styles if style not in LETTER_STYLES]
+        if unknown:
+            raise ValueError(f"Unknown cover letter style: {', '.join(unknown)}")
 
-        # Version 2: Results focus (modify opening)
-        # Version 3: Innovation focus
+        shared = self._prepare_letter(job_description, job_title, hiring_manager)
+
+        versions = []
+        for style in styles:
+            cover_letter = self._render_letter(shared, job_title, company_name, style)
+            if save:
+                self._save_cover_letter(cover_letter, company_name, style)
+            versions.append((style, cover_letter))
 
         return versions
 
@@ -0,0 +1,257 @@
+"""
+Document Renderer
+Renders tailored resumes and cover letters to PDF and DOCX, in parallel across cores
+"""
+
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+try:
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, ListFlowable, ListItem
+except ImportError:
+    A4 = None
+
+try:
+    import docx
+    from docx.shared import Pt
+except ImportError:
+    docx = None
+
+SUPPORTED_FORMATS = ('pdf', 'docx')
+
+# Per-process rendering state (styles, fonts, DOCX template). Built once per
+# worker by _init_worker and reused for every document that worker renders.
+_worker_state = None
+
+
+def _init_worker():
+    """Build reusable layout objects for this process"""
+    global _worker_state
+
+    state = {}
+
+    if A4 is not None:
+        styles = getSampleStyleSheet()
+        state['pdf_styles'] = {
+            'name': ParagraphStyle('Name', parent=styles['Title'], fontSize=18, spaceAfter=4),
+            'contact': ParagraphStyle('Contact', parent=styles['Normal'], fontSize=9, alignment=1),
+            'heading': ParagraphStyle('Heading', parent=styles['Heading2'], fontSize=12,
+                                      spaceBefore=8, spaceAfter=4),
+            'subheading': ParagraphStyle('Subheading', parent=styles['Normal'], fontName='Helvetica-Bold',
+                                         fontSize=10, spaceBefore=4),
+            'body': ParagraphStyle('Body', parent=styles['Normal'], fontSize=10, leading=13),
+            'letter': ParagraphStyle('Letter', parent=styles['Normal'], fontSize=11, leading=15,
+                                     spaceAfter=10),
+        }
+
+    if docx is not None:
+        # Configure fonts once and snapshot the document; each render starts
+        # from these bytes instead of restyling a blank document.
+        template = docx.Document()
+        normal = template.styles['Normal']
+        normal.font.name = 'Calibri'
+        normal.font.size = Pt(10.5)
+        buffer = io.BytesIO()
+        template.save(buffer)
+        state['docx_template'] = buffer.getvalue()
+
+    _worker_state = state
+
+
+def _get_state():
+    """Return rendering state, initializing it on first use in this process"""
+    if _worker_state is None:
+        _init_worker()
+    return _worker_state
+
+
+def _check_format(fmt):
+    """Make sure the backend for a format is installed"""
+    if fmt not in SUPPORTED_FORMATS:
+        raise ValueError(f"Unsupported format: {fmt} (expected one of {', '.join(SUPPORTED_FORMATS)})")
+    if fmt == 'pdf' and A4 is None:
+        raise ImportError("PDF rendering requires reportlab: pip install reportlab")
+    if fmt == 'docx' and docx is None:
+        raise ImportError("DOCX rendering requires python-docx: pip install python-docx")
+
+
+def resume_sections(tailored_data):
+    """Break tailored resume data into (heading, entries) sections.
+
+    Each entry is a (title, lines, bullets) tuple, so the same structure can
+    be laid out by every backend.
+    """
+    sections = [('PROFESSIONAL SUMMARY', [(None, [tailored_data['summary']], [])])]
+
+    skills = []
+    for category, items in tailored_data['skills'].items():
+        if isinstance(items, list):
+            skills.append(f"{category.replace('_', ' ').title()}: {', '.join(items)}")
+    sections.append(('TECHNICAL SKILLS', [(None, skills, [])]))
+
+    sections.append(('PROFESSIONAL EXPERIENCE', [
+        (f"{exp['title']} | {exp['company']}", [f"{exp['dates']} | {exp['location']}"], exp['achievements'])
+        for exp in tailored_data['experience']
+    ]))
+
+    projects = []
+    for proj in tailored_data['projects']:
+        lines = [proj['url']] if 'url' in proj else []
+        lines.append(proj['description'])
+        if proj.get('technologies'):
+            lines.append(f"Technologies: {', '.join(proj['technologies'])}")
+        projects.append((proj['name'], lines, proj.get('achievements', [])))
+    sections.append(('KEY PROJECTS', projects))
+
+    sections.append(('EDUCATION', [
+        (f"{edu['degree']} | {edu['institution']}", [edu['dates']], [])
+        for edu in tailored_data['education']
+    ]))
+
+    sections.append(('CERTIFICATIONS', [(None, [], tailored_data['certifications'])]))
+
+    return sections
+
+
+def _contact_lines(personal):
+    """Contact details shown under the name"""
+    return [
+        f"{personal['location']} | {personal['phone']} | {personal['email']}",
+        f"LinkedIn: linkedin.com/in/{personal['linkedin']} | GitHub: github.com/{personal['github']}",
+        f"Visa Status: {personal['visa_status']}",
+    ]
+
+
+def _render_resume_pdf(tailored_data, output_path):
+    """Lay out a tailored resume as PDF"""
+    styles = _get_state()['pdf_styles']
+    personal = tailored_data['personal_info']
+
+    story = [Paragraph(escape(personal['name']), styles['name'])]
+    for line in _contact_lines(personal):
+        story.append(Paragraph(escape(line), styles['contact']))
+
+    for heading, entries in resume_sections(tailored_data):
+        story.append(Paragraph(heading, styles['heading']))
+        for title, lines, bullets in entries:
+            if title:
+                story.append(Paragraph(escape(title), styles['subheading']))
+            for line in lines:
+                story.append(Paragraph(escape(line), styles['body']))
+            if bullets:
+                story.append(ListFlowable(
+                    [ListItem(Paragraph(escape(b), styles['body'])) for b in bullets],
+                    bulletType='bullet', leftIndent=12
+                ))
+
+    doc = SimpleDocTemplate(output_path, pagesize=A4, leftMargin=18 * mm, rightMargin=18 * mm,
+                            topMargin=15 * mm, bottomMargin=15 * mm)
+    doc.build(story)
+
+
+def _render_resume_docx(tailored_data, output_path):
+    """Lay out a tailored resume as DOCX"""
+    document = docx.Document(io.BytesIO(_get_state()['docx_template']))
+    personal = tailored_data['personal_info']
+
+    document.add_heading(personal['name'], level=0)
+    for line in _contact_lines(personal):
+        document.add_paragraph(line)
+
+    for heading, entries in resume_sections(tailored_data):
+        document.add_heading(heading.title(), level=1)
+        for title, lines, bullets in entries:
+            if title:
+                document.add_paragraph().add_run(title).bold = True
+            for line in lines:
+                document.add_paragraph(line)
+            for bullet in bullets:
+                document.add_paragraph(bullet, style='List Bullet')
+
+    document.save(output_path)
+
+
+def _render_cover_letter_pdf(cover_letter, output_path):
+    """Lay out a cover letter as PDF"""
+    style = _get_state()['pdf_styles']['letter']
+
+    story = []
+    for paragraph in cover_letter.split('\n\n'):
+        story.append(Paragraph(escape(paragraph).replace('\n', '<br/>'), style))
+
+    doc = SimpleDocTemplate(output_path, pagesize=A4, leftMargin=25 * mm, rightMargin=25 * mm,
+                            topMargin=20 * mm, bottomMargin=20 * mm)
+    doc.build(story)
+
+
+def _render_cover_letter_docx(cover_letter, output_path):
+    """Lay out a cover letter as DOCX"""
+    document = docx.Document(io.BytesIO(_get_state()['docx_template']))
+
+    for paragraph in cover_letter.split('\n\n'):
+        document.add_paragraph(paragraph)
+
+    document.save(output_path)
+
+
+_RENDERERS = {
+    ('resume', 'pdf'): _render_resume_pdf,
+    ('resume', 'docx'): _render_resume_docx,
+    ('cover_letter', 'pdf'): _render_cover_letter_pdf,
+    ('cover_letter', 'docx'): _render_cover_letter_docx,
+}
+
+
+def render_document(kind, fmt, content, output_path):
+    """Render a single document in this process.
+
+    kind is 'resume' (content is the tailored resume dict) or 'cover_letter'
+    (content is the letter text); fmt is 'pdf' or 'docx'.
+    """
+    _check_format(fmt)
+    renderer = _RENDERERS.get((kind, fmt))
+    if renderer is None:
+        raise ValueError(f"Unknown document type: {kind}")
+
+    renderer(content, output_path)
+    return output_path
+
+
+def _render_task(task):
+    """Worker entry point; returns (output_path, error)"""
+    try:
+        return render_document(*task), None
+    except Exception as e:
+        return task[3], str(e)
+
+
+def render_documents(tasks, max_workers=None):
+    """Render many documents across a process pool.
+
+    tasks is an iterable of (kind, fmt, content, output_path) tuples.
+    Returns a list of (output_path, error) in task order; error is None on
+    success.
+    """
+    tasks = list(tasks)
+    if not tasks:
+        return []
+
+    # Fail fast on a missing backend instead of once per document
+    for fmt in {task[1] for task in tasks}:
+        _check_format(fmt)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = min(max_workers, len(tasks))
+
+    if max_workers <= 1:
+        return [_render_task(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        return list(executor.map(_render_task, tasks, chunksize=chunksize))
@@ -0,0 +1,106 @@
+"""
+HTTP Response Cache
+Strong ETags, 304 Not Modified and cached gzip/brotli bodies for JSON endpoints
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import Response, current_app, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Bodies smaller than this aren't worth compressing
+MIN_COMPRESS_SIZE = 1024
+
+# Responses kept (each with its compressed variants), least recently used first out
+MAX_ENTRIES = 64
+
+
+def _compress(body, encoding):
+    """Compress a body with 'br' or 'gzip'"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+class ResponseCache:
+    """JSON responses cached per endpoint, query and data version
+
+    Callers pass a version token that changes whenever the data behind an
+    endpoint does. The ETag is derived from it, so a client that already
+    has the current version gets a 304 without the body being built at
+    all; otherwise the serialized body and its compressed forms are built
+    once per version and reused.
+    """
+
+    def __init__(self, max_entries=MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _choose_encoding(self):
+        """Best encoding the client accepts, or None for identity"""
+        accepted = request.accept_encodings
+        if brotli is not None and accepted.quality('br') > 0:
+            return 'br'
+        if accepted.quality('gzip') > 0:
+            return 'gzip'
+        return None
+
+    def respond(self, version, build):
+        """Response for the current request
+
+        build() returns the data to serialize; it is only called when the
+        cache has no body for this version. Exceptions from it propagate.
+        """
+        key = (request.path, request.query_string, str(version))
+        tag = hashlib.sha1(repr(key).encode('utf-8')).hexdigest()[:32]
+        encoding = self._choose_encoding()
+
+        # Each encoding is its own representation, so it gets its own tag;
+        # small bodies go out uncompressed under the plain tag
+        etag = f"{tag}-{encoding}" if encoding else tag
+        for candidate in (etag, tag):
+            if candidate in request.if_none_match:
+                return self._headers(Response(status=304), candidate, None)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is None:
+            body = current_app.json.dumps(build()).encode('utf-8') + b'\n'
+            entry = {None: body}
+            with self._lock:
+                self._entries[key] = entry
+                # Older versions of the same response will never be asked for again
+                for old_key in [k for k in self._entries if k[:2] == key[:2] and k != key]:
+                    del self._entries[old_key]
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        body = entry[None]
+        if encoding is None or len(body) < MIN_COMPRESS_SIZE:
+            return self._headers(Response(body, mimetype='application/json'), tag, None)
+
+        compressed = entry.get(encoding)
+        if compressed is None:
+            compressed = entry[encoding] = _compress(body, encoding)
+        return self._headers(Response(compressed, mimetype='application/json'), etag, encoding)
+
+    def _headers(self, response, etag, encoding):
+        """Add caching headers (and Content-Encoding) to a response"""
+        response.set_etag(etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+        # Cache, but check back every time; the ETag makes that cheap
+        response.headers['Cache-Control'] = 'no-cache'
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        return response
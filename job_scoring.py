@@ -0,0 +1,348 @@
+"""
+Job Scoring
+Rule-based priority scores and top-k selection shared by the web app and the
+job prioritizer
+"""
+
+import hashlib
+import heapq
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow
+    # Arrow-backed strings run lower() and regex matching in native code
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    STRING_DTYPE = object
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scoring_rules.json')
+
+# How often (in seconds) to check the rules file for changes
+RELOAD_INTERVAL = 1.0
+
+# Keys a field may be stored under; application_info.json uses 'job_title'
+FIELD_ALIASES = {
+    'title': ('title', 'job_title'),
+}
+
+
+def _field_text(job, field):
+    """Value of a field (or one of its aliases) as a string, '' if missing"""
+    for key in FIELD_ALIASES.get(field, (field,)):
+        value = job.get(key)
+        if value is not None:
+            return str(value)
+    return ''
+
+
+def _column(jobs, field):
+    """A field (or its aliases) across many jobs, None if missing"""
+    aliases = FIELD_ALIASES.get(field, (field,))
+    values = [job.get(aliases[0]) for job in jobs]
+    for alias in aliases[1:]:
+        if None not in values:
+            break
+        for i, value in enumerate(values):
+            if value is None:
+                values[i] = jobs[i].get(alias)
+    return values
+
+
+def _rules_hash(config):
+    """Stable fingerprint of a rules config, the same across runs"""
+    canonical = json.dumps(config, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()
+
+
+def compile_rules(config):
+    """Turn a rules config (as loaded from scoring_rules.json) into matchers
+
+    Each rule has a field, keywords and points (negative for penalties). A
+    rule scores once if any keyword appears in the lowercased field, or, with
+    "max_matches": n, once per distinct keyword up to n times.
+    """
+    rules = []
+    for rule in config['rules']:
+        keywords = tuple(keyword.lower() for keyword in rule['keywords'])
+        pattern = '|'.join(re.escape(keyword) for keyword in keywords)
+        rules.append((rule['field'], keywords, re.compile(pattern), pattern,
+                      int(rule['points']), int(rule.get('max_matches', 1))))
+
+    return {
+        'rules': tuple(rules),
+        'fields': tuple(sorted({rule[0] for rule in rules})),
+        'source_bonus': dict(config.get('source_bonus', {})),
+        'min_score': config.get('min_score', 0),
+        'max_score': config.get('max_score'),
+        'hash': _rules_hash(config),
+    }
+
+
+class ScoringEngine:
+    """Scores jobs with the rules in a JSON rules file
+
+    The rules are compiled once and recompiled only when the file's
+    modification time changes, so edits apply without a restart.
+    """
+
+    def __init__(self, rules_path=DEFAULT_RULES_PATH):
+        self.rules_path = rules_path
+        self.version = 0
+        self._mtime = None
+        self._checked = 0
+        self._lock = threading.Lock()
+        self.reload()
+
+    def reload(self, force=False):
+        """Recompile the rules if the file changed; returns True if it did"""
+        with self._lock:
+            self._checked = time.monotonic()
+            mtime = os.stat(self.rules_path).st_mtime_ns
+            if mtime == self._mtime and not force:
+                return False
+
+            try:
+                with open(self.rules_path, 'r') as f:
+                    compiled = compile_rules(json.load(f))
+            except (ValueError, KeyError, TypeError) as e:
+                if self.version == 0:
+                    raise
+                # Keep scoring with the last good rules until the file is fixed
+                print(f"⚠️  Could not reload {self.rules_path}: {e}")
+                self._mtime = mtime
+                return False
+
+            self._compiled = compiled
+            self._mtime = mtime
+            self.version += 1
+            return True
+
+    @property
+    def rules_hash(self):
+        """Fingerprint of the current rules; changes whenever scores could"""
+        return self._rules()['hash']
+
+    def content_keys(self, jobs):
+        """64-bit hash of everything in each job the rules look at, as an array"""
+        fields = self._rules()['fields']
+        keys = np.zeros(len(jobs), dtype=np.uint64)
+        for column in [_column(jobs, field) for field in fields] + [[job.get('source') for job in jobs]]:
+            values = np.empty(len(jobs), dtype=object)
+            values[:] = column
+            # pandas hashes with a fixed key, so keys are the same in every run
+            keys = keys * np.uint64(1000003) ^ pd.util.hash_array(values, categorize=False)
+        return keys
+
+    def _rules(self):
+        """Current compiled rules, reloading first if the file may have changed"""
+        if time.monotonic() - self._checked >= RELOAD_INTERVAL:
+            self.reload()
+        return self._compiled
+
+    def _clamp(self, score, compiled):
+        """Apply the rules file's score floor and ceiling"""
+        if compiled['min_score'] is not None:
+            score = max(compiled['min_score'], score)
+        if compiled['max_score'] is not None:
+            score = min(compiled['max_score'], score)
+        return score
+
+    def score(self, job):
+        """Score one job"""
+        compiled = self._rules()
+
+        score = 0
+        texts = {}
+        for field, keywords, regex, _, points, max_matches in compiled['rules']:
+            text = texts.get(field)
+            if text is None:
+                text = texts[field] = _field_text(job, field).lower()
+            if max_matches == 1:
+                if regex.search(text):
+                    score += points
+            else:
+                matched = sum(1 for keyword in keywords if keyword in text)
+                score += min(matched, max_matches) * points
+
+        score += compiled['source_bonus'].get(job.get('source'), 0)
+
+        return self._clamp(score, compiled)
+
+    def score_many(self, jobs):
+        """Score many jobs at once
+
+        Gives the same scores as score(), as a NumPy array, but lowercases
+        each field once and evaluates every rule over the whole column.
+        """
+        compiled = self._rules()
+
+        columns = {}
+        for field in compiled['fields']:
+            column = pd.Series(_column(jobs, field), dtype=object).fillna('').astype(str)
+            columns[field] = column.astype(STRING_DTYPE).str.lower()
+
+        scores = np.zeros(len(jobs), dtype=np.int64)
+        for field, keywords, _, pattern, points, max_matches in compiled['rules']:
+            column = columns[field]
+            if max_matches == 1:
+                matched = column.str.contains(pattern, regex=True).to_numpy(dtype=np.int64)
+            else:
+                matched = np.zeros(len(jobs), dtype=np.int64)
+                for keyword in keywords:
+                    matched += column.str.contains(keyword, regex=False).to_numpy(dtype=np.int64)
+                matched = np.minimum(matched, max_matches)
+            scores += matched * points
+
+        sources = pd.Series([job.get('source') for job in jobs], dtype=object)
+        scores += sources.map(compiled['source_bonus']).fillna(0).to_numpy(dtype=np.int64)
+
+        if compiled['min_score'] is not None:
+            scores = np.maximum(scores, compiled['min_score'])
+        if compiled['max_score'] is not None:
+            scores = np.minimum(scores, compiled['max_score'])
+        return scores
+
+
+class TierSelector:
+    """Single-pass tier bucketing that keeps only the top items of each tier
+
+    Tiers are (name, min_score) pairs from highest to lowest, the last with a
+    min_score of None. Every item added is counted in its tier, but only the
+    best limits[name] are kept (all of them if the limit is None or missing).
+    """
+
+    def __init__(self, tiers, limits=None):
+        self.tiers = tiers
+        self.limits = limits or {}
+        self.counts = {name: 0 for name, _ in tiers}
+        self._heaps = {name: [] for name, _ in tiers}
+        self._added = 0
+
+    def tier_for(self, score):
+        """Name of the tier a score falls in"""
+        for name, min_score in self.tiers:
+            if min_score is None or score >= min_score:
+                return name
+
+    def add(self, item, score):
+        """Count an item in its tier and keep it if it ranks in the tier's top
+
+        Returns the name of the tier.
+        """
+        name = self.tier_for(score)
+        self.counts[name] += 1
+
+        # Earlier items win ties, so later ones rank lower and are dropped first
+        entry = (score, -self._added, item)
+        self._added += 1
+
+        heap = self._heaps[name]
+        limit = self.limits.get(name)
+        if limit is None:
+            heap.append(entry)
+        elif len(heap) < limit:
+            heapq.heappush(heap, entry)
+        elif limit and entry[:2] > heap[0][:2]:
+            heapq.heapreplace(heap, entry)
+        return name
+
+    def add_many(self, items, scores):
+        """Add items with their scores, in order"""
+        for item, score in zip(items, scores):
+            self.add(item, score)
+
+    def results(self):
+        """Kept (item, score) pairs for each tier, highest score first"""
+        return {
+            name: [(item, score) for score, _, item in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+            for name, heap in self._heaps.items()
+        }
+
+
+class ScoreCache:
+    """Job scores saved between runs, keyed by job content and rules version
+
+    Only jobs that are new, changed, or were last scored under different
+    rules are scored again. Keys and scores are kept as NumPy arrays (saved
+    as .npz) so lookups run over whole columns, and only the jobs seen in
+    the latest call are kept, so the cache doesn't grow as old jobs drop out.
+    Callers that know their jobs came from an unchanged file can pass its
+    stamp to skip hashing altogether.
+    """
+
+    def __init__(self, path, engine=None):
+        self.path = path
+        self.engine = engine or get_engine()
+
+        try:
+            with np.load(self.path) as state:
+                self.rules_hash, self.stamp = str(state['rules']), str(state['stamp'])
+                self.keys, self.scores = state['keys'], state['scores']
+        except (FileNotFoundError, ValueError, KeyError, OSError):
+            self.rules_hash = self.stamp = None
+            self.keys = np.zeros(0, dtype=np.uint64)
+            self.scores = np.zeros(0, dtype=np.int64)
+
+    def score_many(self, jobs, stamp=None):
+        """Scores for jobs as a NumPy array, scoring only cache misses
+
+        stamp identifies where the jobs came from (e.g. a file's size and
+        mtime); if it matches the last call, the saved scores are reused
+        without looking at the jobs.
+        """
+        rules_hash = self.engine.rules_hash
+        if rules_hash != self.rules_hash:
+            self.rules_hash, self.stamp = rules_hash, None
+            self.keys = np.zeros(0, dtype=np.uint64)
+            self.scores = np.zeros(0, dtype=np.int64)
+        elif stamp is not None and stamp == self.stamp and len(self.scores) == len(jobs):
+            return self.scores.copy()
+
+        keys = self.engine.content_keys(jobs)
+        known, first = np.unique(self.keys, return_index=True)
+        positions = pd.Index(known).get_indexer(keys) if len(known) else np.full(len(keys), -1)
+
+        scores = np.zeros(len(keys), dtype=np.int64)
+        found = positions >= 0
+        scores[found] = self.scores[first[positions[found]]]
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            scores[missing] = self.engine.score_many([jobs[i] for i in missing])
+
+        self.stamp = None if stamp is None else str(stamp)
+        self.keys, self.scores = keys, scores
+        self.save()
+        return scores.copy()
+
+    def save(self):
+        """Write the cache atomically"""
+        cache_dir = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix='.scores-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, rules=np.array(self.rules_hash), stamp=np.array(str(self.stamp)),
+                         keys=self.keys, scores=self.scores)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+_default_engine = None
+_default_engine_lock = threading.Lock()
+
+
+def get_engine():
+    """The shared engine for the default rules file"""
+    global _default_engine
+    with _default_engine_lock:
+        if _default_engine is None:
+            _default_engine = ScoringEngine()
+        return _default_engine
@@ -10,6 +10,7 @@ from datetime import datetime
 import json
 import time
 from urllib.parse import quote_plus
+from columnar_io import write_records, iter_records, JOB_SCHEMA
 
 class JobScraper:
     def __init__(self):
@@ -167,6 +168,21 @@ class JobScraper:
         else:
             print("⚠️  No jobs to save")
 
+    def save_to_parquet(self, filename='jobs.parquet'):
+        """Save scraped jobs to Parquet (or Arrow IPC for .arrow/.feather files)"""
+        if self.jobs:
+            count = write_records(self.jobs, filename, JOB_SCHEMA)
+            print(f"✅ Saved {count} jobs to {filename}")
+        else:
+            print("⚠️  No jobs to save")
+
+    def load_from_parquet(self, filename='jobs.parquet'):
+        """Load jobs saved with save_to_parquet"""
+        jobs = list(iter_records(filename, drop_nulls=True))
+        self.jobs.extend(jobs)
+        print(f"✅ Loaded {len(jobs)} jobs from {filename}")
+        return jobs
+
     def scrape_naukri(self, keywords="data scientist", location="Bangalore", country="india"):
         """Scrape jobs from Naukri.com (India)"""
         print(f"🔍 Scraping Naukri for {keywords} in {location}...")
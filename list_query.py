@@ -0,0 +1,187 @@
+"""
+List Queries
+Filtering, sorting, cursor pagination and field selection for list endpoints
+"""
+
+import base64
+import heapq
+import json
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Query parameters that switch a list endpoint to paged responses
+QUERY_PARAMS = ('limit', 'cursor', 'fields', 'sort', 'q', 'status', 'source', 'min_score', 'max_score')
+
+
+def wants_page(args):
+    """Whether a request asked for a filtered/paged response"""
+    return any(name in args for name in QUERY_PARAMS)
+
+
+def _split(value):
+    """'a, b,c' -> ['a', 'b', 'c']"""
+    return [part.strip() for part in value.split(',') if part.strip()] if value else []
+
+
+def _sort_value(value, descending):
+    """Ascending-comparable form of a field value
+
+    Numbers (and text like '85.0%') compare by value, other text
+    case-insensitively; missing values go last. For descending sorts the
+    value itself is inverted, so ties still break in ascending id order.
+    """
+    if value is None or value == '':
+        return (3, 0)
+    if isinstance(value, bool):
+        value = int(value)
+    if isinstance(value, (int, float)):
+        number = float(value)
+    else:
+        text = str(value)
+        try:
+            number = float(text.rstrip('%'))
+        except ValueError:
+            if descending:
+                # Negated code points, with a terminator above them all so
+                # that longer strings sort before their prefixes
+                return (2, tuple(-ord(char) for char in text.lower()) + (1,))
+            return (2, text.lower())
+    return (1, -number if descending else number)
+
+
+def _encode_cursor(sort, key):
+    """Opaque cursor naming the last item returned"""
+    raw = json.dumps([sort, key], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _valid_sort_value(kind, comparable, descending):
+    """Whether a decoded (kind, comparable) has the types _sort_value produces"""
+    if kind in (0, 3):
+        return comparable == 0 and _is_int(comparable)
+    if kind == 1:
+        return _is_int(comparable) or isinstance(comparable, float)
+    if kind == 2:
+        if descending:
+            return isinstance(comparable, list) and all(_is_int(part) for part in comparable)
+        return isinstance(comparable, str)
+    return False
+
+
+def _decode_cursor(cursor, sort):
+    """Sort key a cursor points after; it must come from the same sort"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        cursor_sort, ((kind, comparable), item_id, position) = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if cursor_sort != sort:
+        raise ValueError('Cursor was made for a different sort')
+    # Anything else would fail to compare with the items' keys
+    descending = bool(sort) and sort.startswith('-')
+    if not (_is_int(kind) and _valid_sort_value(kind, comparable, descending)
+            and isinstance(item_id, str) and _is_int(position)):
+        raise ValueError('Invalid cursor')
+    # JSON turned the key's tuples into lists
+    if isinstance(comparable, list):
+        comparable = tuple(comparable)
+    return ((kind, comparable), item_id, position)
+
+
+def _matches(item, filters, terms, text_fields):
+    """Whether an item passes every filter and contains every search term"""
+    for field, allowed in filters:
+        if str(item.get(field, '')).lower() not in allowed:
+            return False
+    if terms:
+        text = ' '.join(str(item.get(field) or '') for field in text_fields).lower()
+        if not all(term in text for term in terms):
+            return False
+    return True
+
+
+def query_items(items, args, id_field, text_fields, default_sort=None, score_field='priority_score'):
+    """Apply a request's list parameters to items and return one page
+
+    Parameters (all optional):
+        status, source     comma-separated values to keep (case-insensitive)
+        min_score, max_score   bounds on score_field
+        q                  words that must all appear in text_fields
+        sort               a field, '-field' for descending
+        fields             comma-separated fields to return
+        limit, cursor      page size and the next_cursor from the last page
+
+    Pages use keyset cursors (the last item's sort key plus its id), so
+    with a sort, items added or removed between requests don't shift later
+    pages. Unsorted lists keep their original order and page by position,
+    which does shift when earlier items are added or removed.
+    Selecting a page costs O(n log limit). Returns {'items', 'next_cursor',
+    'total'}, where total counts every matching item. Raises ValueError
+    for bad parameters.
+    """
+    limit = args.get('limit', DEFAULT_PAGE_SIZE)
+    try:
+        limit = int(limit)
+    except ValueError:
+        raise ValueError('limit must be a number')
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    filters = [(field, {value.lower() for value in _split(args.get(field))})
+               for field in ('status', 'source') if args.get(field)]
+    terms = [term.lower() for term in args.get('q', '').split()]
+
+    bounds = []
+    for name, check in (('min_score', lambda score, bound: score >= bound),
+                        ('max_score', lambda score, bound: score <= bound)):
+        if args.get(name) not in (None, ''):
+            try:
+                bounds.append((float(args[name]), check))
+            except ValueError:
+                raise ValueError(f'{name} must be a number')
+
+    sort = args.get('sort') or default_sort
+    descending = bool(sort) and sort.startswith('-')
+    sort_field = sort.lstrip('-') if sort else None
+
+    def sort_key(position, item):
+        # The id and position make every key unique, so pages never overlap;
+        # unsorted lists keep their original order
+        if not sort_field:
+            return ((0, 0), '', position)
+        return (_sort_value(item.get(sort_field), descending), str(item.get(id_field, '')), position)
+
+    matching = []
+    for position, item in enumerate(items):
+        if not _matches(item, filters, terms, text_fields):
+            continue
+        if bounds:
+            score = item.get(score_field)
+            if not isinstance(score, (int, float)) or not all(check(score, bound) for bound, check in bounds):
+                continue
+        matching.append((sort_key(position, item), item))
+
+    if args.get('cursor'):
+        after = _decode_cursor(args['cursor'], sort)
+        remaining = (entry for entry in matching if entry[0] > after)
+    else:
+        remaining = matching
+
+    page = heapq.nsmallest(limit + 1, remaining, key=lambda entry: entry[0])
+
+    next_cursor = None
+    if len(page) > limit:
+        page = page[:limit]
+        next_cursor = _encode_cursor(sort, page[-1][0])
+
+    fields = _split(args.get('fields'))
+    if fields:
+        page_items = [{field: item[field] for field in fields if field in item} for _, item in page]
+    else:
+        page_items = [item for _, item in page]
+
+    return {'items': page_items, 'next_cursor': next_cursor, 'total': len(matching)}
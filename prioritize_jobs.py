@@ -4,163 +4,283 @@ Filters and ranks jobs based on quality and fit
 """
 
 import json
+import os
 import re
+import sys
+import tempfile
+from itertools import islice
+from job_scoring import ScoreCache, TierSelector, get_engine
+
+# Tiers from highest to lowest, with the minimum score for each
+TIERS = (
+    ('tier_1_must_apply', 60),
+    ('tier_2_should_apply', 30),
+    ('tier_3_nice_to_have', 10),
+    ('tier_4_low_priority', None),
+)
+
+# Jobs kept per tier for the recommendations: all of Tier 1 (it is saved in
+# full) and the top of Tier 2
+RECOMMENDATION_LIMITS = {
+    'tier_1_must_apply': None,
+    'tier_2_should_apply': 50,
+    'tier_3_nice_to_have': 0,
+    'tier_4_low_priority': 0,
+}
+
+# Streaming reads the jobs file in chunks and scores jobs in batches
+STREAM_CHUNK_SIZE = 1 << 16
+STREAM_BATCH_SIZE = 10000
+
+# Whitespace and commas between jobs in a JSON array or JSON Lines file
+_JOB_SEPARATORS = re.compile(r'[\s,]*')
+
+
+def iter_jobs(jobs_file, chunk_size=STREAM_CHUNK_SIZE):
+    """Yield jobs one at a time from a JSON array or JSON Lines file
+
+    Only the job being decoded (plus one chunk) is held in memory, so files
+    of any size can be read.
+    """
+    decoder = json.JSONDecoder()
+    with open(jobs_file, 'r') as f:
+        buffer = ''
+        pos = 0
+        started = False
+        eof = False
+        while True:
+            pos = _JOB_SEPARATORS.match(buffer, pos).end()
+            if pos < len(buffer):
+                if not started:
+                    # A JSON array or JSON Lines; either way skip the bracket
+                    started = True
+                    if buffer[pos] == '[':
+                        pos += 1
+                        continue
+                if buffer[pos] == ']':
+                    return
+                try:
+                    job, end = decoder.raw_decode(buffer, pos)
+                except ValueError:
+                    # Probably cut off at the end of the chunk
+                    if eof:
+                        raise ValueError(f"Invalid JSON in {jobs_file} near: {buffer[pos:pos + 80]!r}")
+                else:
+                    yield job
+                    pos = end
+                    continue
+            elif eof:
+                return
+
+            chunk = f.read(chunk_size)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+class _ScoreSpill:
+    """Jobs spilled to one temporary file per score, read back highest first
+
+    Keeps a tier that is saved in full out of memory while preserving the
+    order a stable sort by score would give.
+    """
+
+    def __init__(self):
+        self._dir = tempfile.TemporaryDirectory(prefix='prioritize-')
+        self._files = {}
+
+    def add(self, job, score):
+        """Append a job to its score's file"""
+        f = self._files.get(score)
+        if f is None:
+            f = self._files[score] = open(os.path.join(self._dir.name, f'{score}.jsonl'), 'w+')
+        f.write(json.dumps(job) + '\n')
+
+    def __iter__(self):
+        """Jobs with their priority_score, highest score first"""
+        for score in sorted(self._files, reverse=True):
+            f = self._files[score]
+            f.flush()
+            f.seek(0)
+            for line in f:
+                yield dict(json.loads(line), priority_score=score)
+            f.seek(0, os.SEEK_END)
+
+    def close(self):
+        """Close and delete the temporary files"""
+        for f in self._files.values():
+            f.close()
+        self._dir.cleanup()
+
+
+def _indented_json(value, indent):
+    """JSON for a value nested `indent` spaces deep, as json.dump(indent=2) writes it"""
+    return json.dumps(value, indent=2).replace('\n', '\n' + ' ' * indent)
+
+
+def _write_prioritized(output_file, tier_1, tier_2, summary):
+    """Write the prioritized list as json.dump(..., indent=2) would, streaming Tier 1"""
+    with open(output_file, 'w') as f:
+        f.write('{\n  "tier_1_must_apply": [')
+        first = True
+        for job in tier_1:
+            f.write(('\n' if first else ',\n') + '    ' + _indented_json(job, 4))
+            first = False
+        f.write(']' if first else '\n  ]')
+        f.write(',\n  "tier_2_should_apply": ' + _indented_json(tier_2, 2))
+        f.write(',\n  "summary": ' + _indented_json(summary, 2) + '\n}')
+
+
+def report_recommendations(counts, tier_1, tier_2, total_jobs, limit=50,
+                           output_file='/Users/ABRAHAM/job_application_system/prioritized_jobs.json'):
+    """Print the tier breakdown and top jobs, and save the prioritized list
+
+    tier_1 may be any re-iterable of jobs (it is read twice); returns the
+    summary that was saved.
+    """
+    print("\n" + "="*80)
+    print("🎯 SMART JOB PRIORITIZATION")
+    print("="*80 + "\n")
+
+    print(f"📊 BREAKDOWN:")
+    print(f"   🔥 Tier 1 (MUST APPLY): {counts['tier_1_must_apply']} jobs")
+    print(f"   ⭐ Tier 2 (SHOULD APPLY): {counts['tier_2_should_apply']} jobs")
+    print(f"   ✨ Tier 3 (NICE TO HAVE): {counts['tier_3_nice_to_have']} jobs")
+    print(f"   📋 Tier 4 (LOW PRIORITY): {counts['tier_4_low_priority']} jobs")
+
+    # Recommend focus
+    tier_1_count = counts['tier_1_must_apply']
+    tier_2_count = counts['tier_2_should_apply']
+
+    print(f"\n💡 RECOMMENDATION:")
+    if tier_1_count <= 50:
+        print(f"   Focus on ALL {tier_1_count} Tier 1 jobs")
+        remaining = 50 - tier_1_count
+        print(f"   + Top {remaining} Tier 2 jobs")
+        print(f"   = {min(50, tier_1_count + tier_2_count)} total applications")
+    else:
+        print(f"   Focus on TOP {limit} Tier 1 jobs only")
+
+    print("\n" + "="*80 + "\n")
+
+    # Show Tier 1 jobs
+    print("🔥 TIER 1 - MUST APPLY (Top Priority)")
+    print("-" * 80)
+    for i, job in enumerate(islice(tier_1, 30), 1):
+        print(f"{i:2d}. [{job['priority_score']:3d} pts] {job['title']}")
+        print(f"    {job['company']} | {job['location']} | {job['source']}")
+        print(f"    {job['url'][:80]}...")
+        print()
+
+    if tier_1_count > 30:
+        print(f"    ... and {tier_1_count - 30} more Tier 1 jobs\n")
+
+    # Save prioritized list
+    summary = {
+        'total_jobs': total_jobs,
+        'tier_1_count': tier_1_count,
+        'tier_2_count': tier_2_count,
+        'recommended_focus': min(50, tier_1_count + tier_2_count)
+    }
+    _write_prioritized(output_file, tier_1, tier_2, summary)
+
+    print(f"✅ Prioritized list saved to: {os.path.basename(output_file)}")
+    print(f"\n🎯 Focus on: {summary['recommended_focus']} applications")
+    print("   This is manageable and high-quality!")
+    print("="*80 + "\n")
+
+    return summary
+
+
+def stream_top_recommendations(jobs_file='/Users/ABRAHAM/job_application_system/jobs_comprehensive.json',
+                               limit=50, engine=None, batch_size=STREAM_BATCH_SIZE,
+                               output_file='/Users/ABRAHAM/job_application_system/prioritized_jobs.json'):
+    """get_top_recommendations for job files too big to load
+
+    Reads jobs incrementally (JSON array or JSON Lines), scores each once in
+    batches and keeps only the top of Tier 2 plus per-tier counts; Tier 1,
+    which is saved in full, is spilled to temporary files. Memory use does
+    not grow with the file. Saves the same prioritized_jobs.json and returns
+    its summary.
+    """
+    engine = engine or get_engine()
+    selector = TierSelector(TIERS, dict(RECOMMENDATION_LIMITS, tier_1_must_apply=0))
+    tier_1 = _ScoreSpill()
+    total_jobs = 0
+
+    try:
+        jobs = iter_jobs(jobs_file)
+        while True:
+            batch = list(islice(jobs, batch_size))
+            if not batch:
+                break
+            total_jobs += len(batch)
+
+            scores = engine.score_many(batch).tolist()
+            for job, score in zip(batch, scores):
+                if selector.add(job, score) == 'tier_1_must_apply':
+                    tier_1.add(job, score)
+
+        tier_2 = [dict(job, priority_score=score) for job, score in selector.results()['tier_2_should_apply']]
+        return report_recommendations(selector.counts, tier_1, tier_2, total_jobs, limit, output_file)
+    finally:
+        tier_1.close()
+
 
 class JobPrioritizer:
-    def __init__(self, jobs_file='/Users/ABRAHAM/job_application_system/jobs_comprehensive.json'):
+    def __init__(self, jobs_file='/Users/ABRAHAM/job_application_system/jobs_comprehensive.json', engine=None):
         with open(jobs_file, 'r') as f:
+            stat = os.fstat(f.fileno())
             self.jobs = json.load(f)
+        self.jobs_stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+        # Scoring rules live in scoring_rules.json, shared with the web app
+        self.engine = engine or get_engine()
+        # Scores from earlier runs, so only new or changed jobs are rescored
+        self.cache = ScoreCache(jobs_file + '.scores.npz', self.engine)
 
     def score_job(self, job):
         """Score a job based on various factors"""
-        score = 0
-        title = job['title'].lower()
-        company = job['company'].lower()
-
-        # HIGH PRIORITY KEYWORDS (20 points each)
-        high_priority = [
-            'intern', 'internship', 'graduate', 'entry level', 'junior',
-            'undergraduate', 'student', 'vacationer', 'trainee'
-        ]
-        for keyword in high_priority:
-            if keyword in title:
-                score += 20
-                break
-
-        # TOP COMPANIES (50 points)
-        top_companies = [
-            'google', 'microsoft', 'tiktok', 'meta', 'amazon', 'apple',
-            'atlassian', 'canva', 'ey', 'deloitte', 'pwc', 'kpmg',
-            'commonwealth bank', 'westpac', 'anz', 'nab',
-            'qantas', 'telstra', 'optus'
-        ]
-        for top_company in top_companies:
-            if top_company in company:
-                score += 50
-                break
-
-        # RELEVANT ROLES (15 points each)
-        relevant_roles = [
-            'data scientist', 'data analyst', 'machine learning',
-            'ml engineer', 'ai engineer', 'research', 'java developer',
-            'backend', 'python developer'
-        ]
-        for role in relevant_roles:
-            if role in title:
-                score += 15
-                break
-
-        # BONUS: Part-time/Casual/Flexible (10 points)
-        if any(word in title for word in ['part time', 'casual', 'flexible', 'remote']):
-            score += 10
-
-        # BONUS: Sydney location (5 points)
-        if 'sydney' in job['location'].lower():
-            score += 5
-
-        # PENALTY: Senior/Lead roles (-30 points)
-        if any(word in title for word in ['senior', 'lead', 'principal', 'staff', 'head of']):
-            score -= 30
-
-        # PENALTY: Requires years of experience (-20 points)
-        if any(word in title for word in ['5+', '3+', '10+', 'experienced']):
-            score -= 20
-
-        # BONUS: Source diversity
-        if job['source'] == 'LinkedIn':
-            score += 3
-        elif job['source'] == 'Indeed':
-            score += 2
-
-        return max(0, score)  # Don't go negative
-
-    def categorize_jobs(self):
-        """Categorize jobs into tiers"""
-        scored_jobs = []
-        for job in self.jobs:
-            score = self.score_job(job)
-            job['priority_score'] = score
-            scored_jobs.append(job)
-
-        # Sort by score
-        scored_jobs.sort(key=lambda x: x['priority_score'], reverse=True)
-
-        # Categorize
-        tier_1 = [j for j in scored_jobs if j['priority_score'] >= 60]  # Must apply
-        tier_2 = [j for j in scored_jobs if 30 <= j['priority_score'] < 60]  # Should apply
-        tier_3 = [j for j in scored_jobs if 10 <= j['priority_score'] < 30]  # Nice to have
-        tier_4 = [j for j in scored_jobs if j['priority_score'] < 10]  # Low priority
-
-        return {
-            'tier_1_must_apply': tier_1,
-            'tier_2_should_apply': tier_2,
-            'tier_3_nice_to_have': tier_3,
-            'tier_4_low_priority': tier_4
-        }
-
-    def get_top_recommendations(self, limit=50):
+        return self.engine.score(job)
+
+    def score_jobs(self, jobs=None):
+        """Score many jobs at once, as a NumPy array"""
+        if jobs is None:
+            return self.cache.score_many(self.jobs, stamp=self.jobs_stamp)
+        return self.cache.score_many(jobs)
+
+    def categorize_jobs(self, limits=None):
+        """Categorize jobs into tiers
+
+        limits caps how many of the best jobs are kept per tier (by tier
+        name; None keeps all). Every job is still counted: the totals are
+        in self.tier_counts. Tier entries are copies of the jobs with a
+        priority_score added; self.jobs is left untouched.
+        """
+        selector = TierSelector(TIERS, limits)
+        selector.add_many(range(len(self.jobs)), self.score_jobs().tolist())
+        self.tier_counts = selector.counts
+
+        tiers = {}
+        for name, ranked in selector.results().items():
+            tiers[name] = [dict(self.jobs[index], priority_score=score) for index, score in ranked]
+
+        return tiers
+
+    def get_top_recommendations(self, limit=50,
+                                output_file='/Users/ABRAHAM/job_application_system/prioritized_jobs.json'):
         """Get top N job recommendations"""
-        tiers = self.categorize_jobs()
-
-        print("\n" + "="*80)
-        print("🎯 SMART JOB PRIORITIZATION")
-        print("="*80 + "\n")
-
-        print(f"📊 BREAKDOWN:")
-        print(f"   🔥 Tier 1 (MUST APPLY): {len(tiers['tier_1_must_apply'])} jobs")
-        print(f"   ⭐ Tier 2 (SHOULD APPLY): {len(tiers['tier_2_should_apply'])} jobs")
-        print(f"   ✨ Tier 3 (NICE TO HAVE): {len(tiers['tier_3_nice_to_have'])} jobs")
-        print(f"   📋 Tier 4 (LOW PRIORITY): {len(tiers['tier_4_low_priority'])} jobs")
-
-        # Recommend focus
-        tier_1_count = len(tiers['tier_1_must_apply'])
-        tier_2_count = len(tiers['tier_2_should_apply'])
-
-        print(f"\n💡 RECOMMENDATION:")
-        if tier_1_count <= 50:
-            print(f"   Focus on ALL {tier_1_count} Tier 1 jobs")
-            remaining = 50 - tier_1_count
-            print(f"   + Top {remaining} Tier 2 jobs")
-            print(f"   = {min(50, tier_1_count + tier_2_count)} total applications")
-        else:
-            print(f"   Focus on TOP {limit} Tier 1 jobs only")
-
-        print("\n" + "="*80 + "\n")
+        # Only Tier 1 and the top of Tier 2 are shown or saved
+        tiers = self.categorize_jobs(limits=RECOMMENDATION_LIMITS)
 
-        # Show Tier 1 jobs
-        print("🔥 TIER 1 - MUST APPLY (Top Priority)")
-        print("-" * 80)
-        for i, job in enumerate(tiers['tier_1_must_apply'][:30], 1):
-            print(f"{i:2d}. [{job['priority_score']:3d} pts] {job['title']}")
-            print(f"    {job['company']} | {job['location']} | {job['source']}")
-            print(f"    {job['url'][:80]}...")
-            print()
+        summary = report_recommendations(self.tier_counts, tiers['tier_1_must_apply'],
+                                         tiers['tier_2_should_apply'], len(self.jobs), limit, output_file)
 
-        if len(tiers['tier_1_must_apply']) > 30:
-            print(f"    ... and {len(tiers['tier_1_must_apply']) - 30} more Tier 1 jobs\n")
-
-        # Save prioritized list
-        output = {
+        return {
             'tier_1_must_apply': tiers['tier_1_must_apply'],
-            'tier_2_should_apply': tiers['tier_2_should_apply'][:50],
-            'summary': {
-                'total_jobs': len(self.jobs),
-                'tier_1_count': len(tiers['tier_1_must_apply']),
-                'tier_2_count': len(tiers['tier_2_should_apply']),
-                'recommended_focus': min(50, tier_1_count + tier_2_count)
-            }
+            'tier_2_should_apply': tiers['tier_2_should_apply'],
+            'summary': summary
         }
 
-        with open('/Users/ABRAHAM/job_application_system/prioritized_jobs.json', 'w') as f:
-            json.dump(output, f, indent=2)
-
-        print(f"✅ Prioritized list saved to: prioritized_jobs.json")
-        print(f"\n🎯 Focus on: {output['summary']['recommended_focus']} applications")
-        print("   This is manageable and high-quality!")
-        print("="*80 + "\n")
-
-        return output
-
     def create_filtered_applications(self, tier='tier_1'):
         """Create application materials only for high-priority jobs"""
         from resume_tailor import ResumeTailor
@@ -168,8 +288,12 @@ class JobPrioritizer:
         import os
         import glob
 
-        tiers = self.categorize_jobs()
-        jobs_to_apply = tiers[f'{tier}_must_apply'] if tier == 'tier_1' else tiers['tier_1_must_apply'] + tiers['tier_2_should_apply'][:20]
+        tiers = self.categorize_jobs(limits={
+            'tier_2_should_apply': 0 if tier == 'tier_1' else 20,
+            'tier_3_nice_to_have': 0,
+            'tier_4_low_priority': 0,
+        })
+        jobs_to_apply = tiers['tier_1_must_apply'] + tiers['tier_2_should_apply']
 
         print(f"\n🎯 Creating applications for {len(jobs_to_apply)} prioritized jobs...")
 
@@ -256,8 +380,12 @@ class JobPrioritizer:
 
 
 def main():
-    prioritizer = JobPrioritizer()
-    recommendations = prioritizer.get_top_recommendations(limit=50)
+    if '--stream' in sys.argv:
+        # Large job files: read incrementally instead of loading them whole
+        stream_top_recommendations(limit=50)
+    else:
+        prioritizer = JobPrioritizer()
+        recommendations = prioritizer.get_top_recommendations(limit=50)
 
     print("\n💡 NEXT STEPS:")
     print("1. Focus on Tier 1 jobs (highest quality matches)")
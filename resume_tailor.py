@@ -8,6 +8,7 @@ import re
 from collections import Counter
 from datetime import datetime
 import os
+from document_renderer import render_document, SUPPORTED_FORMATS
 
 class ResumeTailor:
     def __init__(self, resume_data_path=None):
@@ -170,6 +171,11 @@ class ResumeTailor:
             base_dir = os.path.dirname(os.path.abspath(__file__))
             text_filename = os.path.join(base_dir, f"tailored_resume_{timestamp}.txt")
             self._generate_text_resume(tailored, text_filename, job_title, company_name)
+        elif output_format in SUPPORTED_FORMATS:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            doc_filename = os.path.join(base_dir, f"tailored_resume_{timestamp}.{output_format}")
+            render_document('resume', output_format, tailored, doc_filename)
+            print(f"✅ {output_format.upper()} resume saved: {doc_filename}")
 
         return tailored
 
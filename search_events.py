@@ -0,0 +1,89 @@
+"""
+Search Events
+Server-Sent Events broker for live job search progress
+"""
+
+import json
+import threading
+from collections import deque
+
+# Recent events kept for clients that reconnect with Last-Event-ID
+HISTORY_SIZE = 1000
+
+# Seconds between heartbeat comments on an idle stream, so proxies and
+# browsers don't drop it
+HEARTBEAT_INTERVAL = 15
+
+# How long browsers wait before reconnecting a dropped stream, in ms
+RETRY_MS = 3000
+
+
+def format_event(event_id, event_type, data):
+    """One event in text/event-stream format"""
+    return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+class EventBroker:
+    """Fans events out to any number of SSE streams
+
+    Publishing appends to a bounded history and wakes waiting streams; each
+    stream blocks on a shared condition instead of polling, so idle clients
+    cost nothing but a thread.
+    """
+
+    def __init__(self, history_size=HISTORY_SIZE):
+        self._history = deque(maxlen=history_size)
+        self._last_id = 0
+        self._condition = threading.Condition()
+
+    def publish(self, event_type, data):
+        """Record an event and wake every stream; returns its id"""
+        with self._condition:
+            self._last_id += 1
+            self._history.append((self._last_id, event_type, data))
+            self._condition.notify_all()
+            return self._last_id
+
+    def events_after(self, last_id, timeout=None):
+        """Events newer than last_id, waiting up to timeout for one to arrive
+
+        An id from before a server restart (higher than any current id) is
+        treated as 0, so the client gets everything still in the history.
+        """
+        with self._condition:
+            if last_id > self._last_id:
+                last_id = 0
+            if timeout and self._last_id <= last_id:
+                self._condition.wait(timeout)
+            return [event for event in self._history if event[0] > last_id]
+
+    def stream(self, last_event_id=None, snapshot=None):
+        """Generate a text/event-stream body
+
+        Replays history after last_event_id (a reconnect) and then follows
+        new events, sending a heartbeat comment whenever the stream has been
+        idle for HEARTBEAT_INTERVAL. A fresh connection starts with
+        snapshot() (an (event_type, data) pair) instead of the full history.
+        """
+        yield f"retry: {RETRY_MS}\n\n"
+
+        try:
+            last_id = int(last_event_id)
+        except (TypeError, ValueError):
+            last_id = None
+
+        if last_id is None:
+            with self._condition:
+                last_id = self._last_id
+            if snapshot is not None:
+                event_type, data = snapshot()
+                yield format_event(last_id, event_type, data)
+
+        while True:
+            events = self.events_after(last_id, timeout=HEARTBEAT_INTERVAL)
+            if not events:
+                yield ": heartbeat\n\n"
+                continue
+            for event_id, event_type, data in events:
+                yield format_event(event_id, event_type, data)
+            last_id = events[-1][0]
@@ -0,0 +1,349 @@
+"""
+Search Queue
+Durable, prioritized queue of job searches stored in SQLite
+"""
+
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+CANCELLED = 'cancelled'
+ACTIVE_STATES = (QUEUED, RUNNING)
+
+# Seconds an idle worker waits before looking for searches queued by
+# another process (searches queued by this one wake it straight away)
+POLL_INTERVAL = 2.0
+
+# Running searches are stamped this often; a search not stamped for
+# STALE_AFTER seconds belonged to a server that stopped, and is queued again
+HEARTBEAT_INTERVAL = 10.0
+STALE_AFTER = 60.0
+
+# A search interrupted this many times is marked failed instead of retried
+MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS search_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    params TEXT NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    state TEXT NOT NULL DEFAULT 'queued',
+    progress INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    total_jobs INTEGER NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    worker TEXT,
+    heartbeat REAL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_search_jobs_next ON search_jobs(state, priority DESC, id);
+"""
+
+# Fields a running search may report
+PROGRESS_FIELDS = ('progress', 'message', 'total_jobs')
+
+
+def _now():
+    """Timestamp in the format the trackers use"""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class SearchCancelled(Exception):
+    """Raised inside a search once it has been cancelled"""
+
+
+class SearchTask:
+    """What a running search gets: its parameters and a way to report progress"""
+
+    def __init__(self, queue, job):
+        self.queue = queue
+        self.id = job['id']
+        self.params = job['params']
+
+    def update(self, **progress):
+        """Record progress/message/total_jobs; raises SearchCancelled if cancelled"""
+        self.queue._update_progress(self.id, progress)
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        """Raise SearchCancelled if someone cancelled this search"""
+        if self.queue._cancel_requested(self.id):
+            raise SearchCancelled()
+
+
+class SearchQueue:
+    """Job searches queued in SQLite and run by a bounded pool of threads
+
+    Searches run highest priority first, then oldest first, at most
+    max_workers at a time. Everything about a search (parameters, state,
+    progress) lives in the database, so the queue survives restarts and
+    can be shared by several server processes: searches are claimed under
+    the database's write lock, which makes max_workers a limit for all of
+    them together, and ones whose server died are queued again once their
+    heartbeat goes stale.
+
+    handler(task) runs one search; it reports through task.update() and
+    stops by letting SearchCancelled propagate. on_change(job, status), if
+    given, is called whenever this process changes a search.
+    """
+
+    def __init__(self, db_path, handler, max_workers=1, on_change=None):
+        self.db_path = db_path
+        self.handler = handler
+        self.max_workers = max_workers
+        self.on_change = on_change
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+        self.conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._lock = threading.RLock()
+
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Start the worker threads and the heartbeat"""
+        if self._threads:
+            return
+        self._recover()
+        for _ in range(self.max_workers):
+            self._threads.append(threading.Thread(target=self._work, daemon=True))
+        self._threads.append(threading.Thread(target=self._keep_alive, daemon=True))
+        for thread in self._threads:
+            thread.start()
+
+    def close(self):
+        """Stop taking new searches (running ones finish in the background)"""
+        self._stop.set()
+        self._wake.set()
+
+    def _job(self, row):
+        """Public dict for a search_jobs row"""
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['cancel_requested'] = bool(job['cancel_requested'])
+        del job['worker'], job['heartbeat']
+        if job['state'] == QUEUED:
+            # Searches that will run before this one
+            job['position'] = self.conn.execute(
+                'SELECT COUNT(*) FROM search_jobs WHERE state = ? AND (priority > ? OR (priority = ? AND id < ?))',
+                (QUEUED, job['priority'], job['priority'], job['id'])
+            ).fetchone()[0]
+        return job
+
+    def _changed(self, job_id):
+        """Tell on_change about a search that changed"""
+        if self.on_change is None:
+            return
+        job = self.get(job_id)
+        if job is not None:
+            self.on_change(job, self.status())
+
+    def submit(self, params, priority=0):
+        """Queue a search; returns its job dict"""
+        with self._lock, self.conn:
+            job_id = self.conn.execute(
+                'INSERT INTO search_jobs (params, priority, state, message, created_at) VALUES (?, ?, ?, ?, ?)',
+                (json.dumps(params), priority, QUEUED, 'Waiting to start...', _now())
+            ).lastrowid
+        self._wake.set()
+        self._changed(job_id)
+        return self.get(job_id)
+
+    def cancel(self, job_id):
+        """Cancel a search: queued ones at once, running ones at their next step
+
+        Returns the job dict, or None if there is no such search.
+        """
+        with self._lock, self.conn:
+            self.conn.execute(
+                'UPDATE search_jobs SET state = ?, message = ?, finished_at = ? WHERE id = ? AND state = ?',
+                (CANCELLED, 'Search cancelled', _now(), job_id, QUEUED)
+            )
+            self.conn.execute(
+                'UPDATE search_jobs SET cancel_requested = 1, message = ? WHERE id = ? AND state = ?',
+                ('Cancelling...', job_id, RUNNING)
+            )
+        self._changed(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id):
+        """One search's job dict, or None"""
+        with self._lock:
+            row = self.conn.execute('SELECT * FROM search_jobs WHERE id = ?', (job_id,)).fetchone()
+            return self._job(row) if row else None
+
+    def jobs(self, states=None, limit=50):
+        """Most recent searches first, optionally only those in the given states"""
+        query, args = 'SELECT * FROM search_jobs', []
+        if states:
+            query += f" WHERE state IN ({', '.join('?' for _ in states)})"
+            args.extend(states)
+        query += ' ORDER BY id DESC LIMIT ?'
+        args.append(limit)
+        with self._lock:
+            return [self._job(row) for row in self.conn.execute(query, args).fetchall()]
+
+    def status(self):
+        """Summary of the queue in the shape of the old search_status
+
+        Describes the oldest running search, else the next queued one, else
+        the last one to finish.
+        """
+        with self._lock:
+            counts = dict(self.conn.execute(
+                f"SELECT state, COUNT(*) FROM search_jobs WHERE state IN ({', '.join('?' for _ in ACTIVE_STATES)}) "
+                'GROUP BY state', ACTIVE_STATES
+            ).fetchall())
+            row = (
+                self.conn.execute('SELECT * FROM search_jobs WHERE state = ? ORDER BY started_at, id LIMIT 1',
+                                  (RUNNING,)).fetchone()
+                or self.conn.execute('SELECT * FROM search_jobs WHERE state = ? ORDER BY priority DESC, id LIMIT 1',
+                                     (QUEUED,)).fetchone()
+                or self.conn.execute('SELECT * FROM search_jobs ORDER BY finished_at DESC, id DESC LIMIT 1').fetchone()
+            )
+
+        status = {
+            'running': bool(counts),
+            'progress': 0,
+            'message': '',
+            'total_jobs': 0,
+            'job_id': None,
+            'state': None,
+            'queued': counts.get(QUEUED, 0),
+            'active': counts.get(RUNNING, 0)
+        }
+        if row is not None:
+            status.update({field: row[field] for field in PROGRESS_FIELDS})
+            status.update(job_id=row['id'], state=row['state'])
+        return status
+
+    def _claim(self):
+        """Take the next queued search for this process, or None
+
+        Runs under the database's write lock, so the max_workers limit holds
+        across every process sharing the queue.
+        """
+        with self._lock, self.conn:
+            self.conn.execute('BEGIN IMMEDIATE')
+            running = self.conn.execute('SELECT COUNT(*) FROM search_jobs WHERE state = ?', (RUNNING,)).fetchone()[0]
+            if running >= self.max_workers:
+                return None
+            row = self.conn.execute(
+                'SELECT id FROM search_jobs WHERE state = ? ORDER BY priority DESC, id LIMIT 1', (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                'UPDATE search_jobs SET state = ?, worker = ?, heartbeat = ?, started_at = ?, '
+                "attempts = attempts + 1, progress = 0, message = 'Initializing search...' WHERE id = ?",
+                (RUNNING, self.worker_id, time.time(), _now(), row['id'])
+            )
+        return self.get(row['id'])
+
+    def _work(self):
+        """Worker thread: run queued searches until closed"""
+        while not self._stop.is_set():
+            job = self._claim()
+            if job is None:
+                self._wake.wait(POLL_INTERVAL)
+                self._wake.clear()
+                continue
+            self._run(job)
+
+    def _run(self, job):
+        """Run one claimed search and record how it ended"""
+        self._changed(job['id'])
+        try:
+            self.handler(SearchTask(self, job))
+        except SearchCancelled:
+            self._finish(job['id'], CANCELLED, 'Search cancelled')
+        except Exception as e:
+            print(f"Search error: {e}")
+            self._finish(job['id'], FAILED, f'Error: {str(e)}')
+        else:
+            self._finish(job['id'], DONE)
+
+    def _finish(self, job_id, state, message=None):
+        """Move a search to a final state, keeping its last message unless given one"""
+        with self._lock, self.conn:
+            self.conn.execute(
+                'UPDATE search_jobs SET state = ?, message = COALESCE(?, message), finished_at = ?, worker = NULL '
+                'WHERE id = ?',
+                (state, message, _now(), job_id)
+            )
+        self._changed(job_id)
+
+    def _update_progress(self, job_id, progress):
+        """Store reported progress; it also counts as a heartbeat"""
+        fields = [field for field in PROGRESS_FIELDS if field in progress]
+        if not fields:
+            return
+        with self._lock, self.conn:
+            self.conn.execute(
+                f"UPDATE search_jobs SET {', '.join(f'{field} = ?' for field in fields)}, heartbeat = ? WHERE id = ?",
+                [progress[field] for field in fields] + [time.time(), job_id]
+            )
+        self._changed(job_id)
+
+    def _cancel_requested(self, job_id):
+        """Whether a running search has been asked to stop"""
+        with self._lock:
+            row = self.conn.execute('SELECT cancel_requested FROM search_jobs WHERE id = ?', (job_id,)).fetchone()
+        return bool(row and row['cancel_requested'])
+
+    def _keep_alive(self):
+        """Heartbeat thread: stamp this process's searches and recover stale ones"""
+        while not self._stop.wait(HEARTBEAT_INTERVAL):
+            try:
+                with self._lock, self.conn:
+                    self.conn.execute(
+                        'UPDATE search_jobs SET heartbeat = ? WHERE state = ? AND worker = ?',
+                        (time.time(), RUNNING, self.worker_id)
+                    )
+                self._recover()
+            except sqlite3.Error as e:
+                print(f"⚠️  Search queue heartbeat failed: {e}")
+
+    def _recover(self):
+        """Queue again (or give up on) searches whose server stopped mid-run"""
+        stale_before = time.time() - STALE_AFTER
+        with self._lock, self.conn:
+            rows = self.conn.execute(
+                'SELECT id, attempts, cancel_requested FROM search_jobs '
+                'WHERE state = ? AND (heartbeat IS NULL OR heartbeat < ?)',
+                (RUNNING, stale_before)
+            ).fetchall()
+            for row in rows:
+                if row['cancel_requested']:
+                    state, message = CANCELLED, 'Search cancelled'
+                elif row['attempts'] >= MAX_ATTEMPTS:
+                    state, message = FAILED, f"Error: interrupted {row['attempts']} times"
+                else:
+                    state, message = QUEUED, 'Interrupted by a server restart; waiting to start again...'
+                self.conn.execute(
+                    'UPDATE search_jobs SET state = ?, message = ?, worker = NULL, '
+                    'finished_at = CASE WHEN ? = ? THEN NULL ELSE ? END WHERE id = ?',
+                    (state, message, state, QUEUED, _now(), row['id'])
+                )
+
+        if rows:
+            self._wake.set()
+            for row in rows:
+                self._changed(row['id'])
@@ -0,0 +1,576 @@
+"""
+SQLite Application Tracker
+Same API as ApplicationTracker, stored in SQLite with indexes and full-text search
+"""
+
+import json
+import os
+import sqlite3
+import sys
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from application_tracker import (ApplicationTracker, load_applications_file, make_event, job_platform, tokenize,
+                                 _date_key, CLOSED_STATUSES, RESPONDED_STATUSES, SEARCH_FIELD_WEIGHTS)
+
+COLUMNS = (
+    'id', 'job_title', 'company', 'location', 'job_url', 'status', 'date_applied',
+    'date_updated', 'notes', 'follow_up_date', 'resume_version', 'cover_letter_version', 'source'
+)
+
+EVENT_COLUMNS = (
+    'app_id', 'at', 'type', 'status', 'previous_status', 'follow_up_date', 'note', 'source', 'platform'
+)
+
+# Bumped when a migration step is added below
+SCHEMA_VERSION = 3
+
+# Columns added after a table was first released: (table, column, type)
+ADDED_COLUMNS = (
+    ('applications', 'source', 'TEXT'),
+    ('application_events', 'source', 'TEXT'),
+    ('application_events', 'platform', 'TEXT'),
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS applications (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_title TEXT NOT NULL,
+    company TEXT NOT NULL,
+    location TEXT,
+    job_url TEXT,
+    status TEXT NOT NULL,
+    date_applied TEXT,
+    date_updated TEXT,
+    notes TEXT NOT NULL DEFAULT '',
+    follow_up_date TEXT,
+    resume_version TEXT,
+    cover_letter_version TEXT,
+    source TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_applications_status ON applications(status);
+CREATE INDEX IF NOT EXISTS idx_applications_company ON applications(company);
+CREATE INDEX IF NOT EXISTS idx_applications_date_applied ON applications(date_applied);
+CREATE INDEX IF NOT EXISTS idx_applications_follow_up_date ON applications(follow_up_date);
+CREATE TABLE IF NOT EXISTS application_events (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    app_id INTEGER NOT NULL,
+    at TEXT NOT NULL,
+    type TEXT NOT NULL,
+    status TEXT,
+    previous_status TEXT,
+    follow_up_date TEXT,
+    note TEXT,
+    source TEXT,
+    platform TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_application_events_app ON application_events(app_id, seq);
+CREATE TABLE IF NOT EXISTS follow_up_reminders (
+    app_id INTEGER NOT NULL,
+    follow_up_date TEXT NOT NULL,
+    PRIMARY KEY (app_id, follow_up_date)
+);
+"""
+
+# Open follow-ups due by a date; served by idx_applications_follow_up_date
+OPEN_FOLLOWUPS_WHERE = (
+    'follow_up_date IS NOT NULL AND follow_up_date <= ? '
+    f"AND status NOT IN ({', '.join('?' for _ in CLOSED_STATUSES)})"
+)
+
+# FTS table kept in sync with triggers. It holds its own copy of the text
+# because the history column (every event note) isn't a column of
+# applications; status changes don't touch it at all.
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(job_title, company, notes, history);
+CREATE TRIGGER IF NOT EXISTS applications_ai AFTER INSERT ON applications BEGIN
+    INSERT INTO applications_fts(rowid, job_title, company, notes, history)
+    VALUES (new.id, new.job_title, new.company, new.notes, '');
+END;
+CREATE TRIGGER IF NOT EXISTS applications_ad AFTER DELETE ON applications BEGIN
+    DELETE FROM applications_fts WHERE rowid = old.id;
+END;
+CREATE TRIGGER IF NOT EXISTS applications_au AFTER UPDATE OF job_title, company, notes ON applications BEGIN
+    UPDATE applications_fts SET job_title = new.job_title, company = new.company, notes = new.notes
+    WHERE rowid = new.id;
+END;
+CREATE TRIGGER IF NOT EXISTS application_events_ai AFTER INSERT ON application_events
+WHEN new.note IS NOT NULL AND new.note != '' BEGIN
+    UPDATE applications_fts SET history = trim(history || ' ' || new.note) WHERE rowid = new.app_id;
+END;
+"""
+
+# Version 2 databases have an external-content FTS table without history
+OLD_FTS_SCHEMA_DROP = """
+DROP TRIGGER IF EXISTS applications_ai;
+DROP TRIGGER IF EXISTS applications_ad;
+DROP TRIGGER IF EXISTS applications_au;
+DROP TABLE IF EXISTS applications_fts;
+"""
+
+
+class SQLiteApplicationTracker(ApplicationTracker):
+    def __init__(self, db_path=None, json_path=None):
+        """Initialize tracker with a SQLite database
+
+        On first use the database is populated from json_path (default:
+        applications.json next to this module) if that file exists.
+        """
+        base_dir = os.path.dirname(os.path.abspath(__file__))
+        if db_path is None:
+            db_path = os.path.join(base_dir, 'applications.db')
+        if json_path is None:
+            json_path = os.path.join(base_dir, 'applications.json')
+        self.db_path = db_path
+        self.reminder_hooks = []
+        self._batch_depth = 0
+
+        self.conn = sqlite3.connect(db_path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.executescript(SCHEMA)
+        self._add_missing_columns()
+
+        # user_version 0 means a fresh database that hasn't been migrated
+        version = self.conn.execute('PRAGMA user_version').fetchone()[0]
+        if version < 3:
+            self.conn.executescript(OLD_FTS_SCHEMA_DROP)
+
+        try:
+            self.conn.executescript(FTS_SCHEMA)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search falls back to LIKE
+            self.has_fts = False
+
+        if version == 0 and os.path.exists(json_path):
+            self.migrate_from_json(json_path)
+        if version < 2:
+            self._start_event_log()
+        if version < 3 and self.has_fts:
+            self._rebuild_search_index()
+        if version < SCHEMA_VERSION:
+            self.conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
+    def _add_missing_columns(self):
+        """Bring tables created by older versions up to the current columns"""
+        for table, column, column_type in ADDED_COLUMNS:
+            existing = {row['name'] for row in self.conn.execute(f'PRAGMA table_info({table})')}
+            if column not in existing:
+                self.conn.execute(f'ALTER TABLE {table} ADD COLUMN {column} {column_type}')
+
+    def refresh(self):
+        """Nothing to pick up; every query reads the database as it is now"""
+        return False
+
+    @property
+    def applications(self):
+        """All applications, oldest first"""
+        rows = self.conn.execute('SELECT * FROM applications ORDER BY id')
+        return [dict(row) for row in rows]
+
+    def migrate_from_json(self, json_path):
+        """Import every application (and its event log) from a JSON tracker file in one transaction"""
+        applications, next_id, _ = load_applications_file(json_path)
+
+        events = []
+        events_path = os.path.splitext(json_path)[0] + '.events.jsonl'
+        if os.path.exists(events_path):
+            with open(events_path, 'r') as f:
+                events = [json.loads(line) for line in f if line.strip()]
+
+        rows = [tuple(app.get(column) if column != 'notes' else (app.get('notes') or '')
+                      for column in COLUMNS)
+                for app in applications]
+
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO applications ({', '.join(COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+                rows
+            )
+            # Keep AUTOINCREMENT past every ID the JSON tracker handed out
+            cursor = self.conn.execute(
+                "UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'applications'", (next_id - 1,)
+            )
+            if not cursor.rowcount:
+                self.conn.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) VALUES ('applications', ?)", (next_id - 1,)
+                )
+            self.conn.executemany(
+                f"INSERT INTO application_events ({', '.join(EVENT_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in EVENT_COLUMNS)})",
+                [tuple(event.get(column) for column in EVENT_COLUMNS) for event in events]
+            )
+
+        print(f"✅ Migrated {len(rows)} applications from {json_path}")
+        return len(rows)
+
+    def _start_event_log(self):
+        """Give applications without any history a 'created' event"""
+        rows = self.conn.execute(
+            'SELECT * FROM applications WHERE id NOT IN (SELECT app_id FROM application_events) ORDER BY id'
+        ).fetchall()
+        with self.conn:
+            for row in rows:
+                self._insert_event(row['id'], make_event(
+                    'created', at=row['date_updated'] or row['date_applied'] or '', status=row['status'],
+                    source=row['source'], platform=job_platform(row['job_url'])
+                ))
+
+    def _rebuild_search_index(self):
+        """Fill the FTS table from the applications and their event notes"""
+        with self.conn:
+            self.conn.execute('DELETE FROM applications_fts')
+            self.conn.execute(
+                'INSERT INTO applications_fts(rowid, job_title, company, notes, history) '
+                'SELECT id, job_title, company, notes, '
+                "(SELECT coalesce(group_concat(note, ' '), '') FROM "
+                "(SELECT note FROM application_events WHERE app_id = applications.id AND note != '' ORDER BY seq)) "
+                'FROM applications'
+            )
+
+    def _insert_event(self, app_id, event):
+        """Append an event to the history (without committing)"""
+        event = dict(event, app_id=app_id)
+        self.conn.execute(
+            f"INSERT INTO application_events ({', '.join(EVENT_COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in EVENT_COLUMNS)})",
+            tuple(event.get(column) for column in EVENT_COLUMNS)
+        )
+
+    @staticmethod
+    def _event_from_row(row):
+        """Event dict in the same shape as the JSON event log"""
+        return {column: row[column] for column in EVENT_COLUMNS if row[column] is not None}
+
+    def _all_events(self):
+        """Every event, oldest first"""
+        rows = self.conn.execute('SELECT * FROM application_events ORDER BY seq')
+        return (self._event_from_row(row) for row in rows)
+
+    def events_since(self, position=0):
+        """Events after a sequence number; returns (events, new_position)
+
+        Returns None if the log no longer reaches position.
+        """
+        last = self.conn.execute('SELECT COALESCE(MAX(seq), 0) FROM application_events').fetchone()[0]
+        if last < position:
+            return None
+        rows = self.conn.execute(
+            'SELECT * FROM application_events WHERE seq > ? AND seq <= ? ORDER BY seq', (position, last)
+        )
+        return [self._event_from_row(row) for row in rows], last
+
+    def get_history(self, app_id):
+        """Status changes, follow-ups and notes for an application, oldest first"""
+        rows = self.conn.execute('SELECT * FROM application_events WHERE app_id = ? ORDER BY seq', (app_id,))
+        return [self._event_from_row(row) for row in rows]
+
+    def get_timeline(self, since=None, limit=None):
+        """Events across all applications, newest first, optionally since a date"""
+        rows = self.conn.execute(
+            'SELECT * FROM application_events WHERE at >= ? ORDER BY seq DESC LIMIT ?',
+            (_date_key(since) if since is not None else '', -1 if limit is None else limit)
+        )
+        return [self._event_from_row(row) for row in rows]
+
+    def add_application(self, job_title, company, job_url, location="Sydney, Australia",
+                       status="Applied", date_applied=None, notes="", source=None):
+        """Add new job application"""
+        with self._transaction():
+            app_id = self._insert_application(job_title, company, job_url, location, status, date_applied, notes,
+                                              source)
+
+        print(f"✅ Added application: {job_title} at {company}")
+        return app_id
+
+    def _insert_application(self, job_title, company, job_url, location="Sydney, Australia",
+                            status="Applied", date_applied=None, notes="", source=None):
+        """Insert an application row (without committing) and return its ID"""
+        if date_applied is None:
+            date_applied = datetime.now().strftime('%Y-%m-%d')
+
+        cursor = self.conn.execute(
+            "INSERT INTO applications (job_title, company, location, job_url, status, "
+            "date_applied, date_updated, notes, source) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (job_title, company, location, job_url, status, date_applied,
+             datetime.now().strftime('%Y-%m-%d %H:%M:%S'), notes or '', source)
+        )
+        self._insert_event(cursor.lastrowid, make_event('created', status=status, source=source,
+                                                        platform=job_platform(job_url)))
+        return cursor.lastrowid
+
+    def add_applications(self, applications):
+        """Add many applications in one transaction"""
+        results = []
+        with self._transaction():
+            for item in applications:
+                error = self._validate_application(item)
+                if error:
+                    results.append({'success': False, 'error': error})
+                else:
+                    results.append({'success': True, 'id': self._insert_application(**item)})
+
+        self._report_bulk('Added', 'applications', results)
+        return results
+
+    def update_status(self, app_id, new_status, notes=""):
+        """Update application status"""
+        with self._transaction():
+            updated = self._update_status_row(app_id, new_status, notes)
+
+        if updated:
+            print(f"✅ Updated #{app_id} to: {new_status}")
+            return True
+
+        print(f"❌ Application #{app_id} not found")
+        return False
+
+    def _update_status_row(self, app_id, new_status, notes=""):
+        """Update one row's status (without committing); returns True if it exists"""
+        row = self.conn.execute('SELECT status FROM applications WHERE id = ?', (app_id,)).fetchone()
+        if row is None:
+            return False
+
+        self.conn.execute(
+            "UPDATE applications SET status = ?, date_updated = ? WHERE id = ?",
+            (new_status, datetime.now().strftime('%Y-%m-%d %H:%M:%S'), app_id)
+        )
+        self._insert_event(app_id, make_event('status', status=new_status, previous_status=row['status'],
+                                              note=notes))
+        return True
+
+    def update_statuses(self, updates):
+        """Update many application statuses in one transaction"""
+        results = {}
+        with self._transaction():
+            for app_id, update in updates.items():
+                new_status, notes, error = self._parse_status_update(update)
+                if error is None and not self._update_status_row(app_id, new_status, notes):
+                    error = f"Application #{app_id} not found"
+                results[app_id] = {'success': False, 'error': error} if error else {'success': True}
+
+        self._report_bulk('Updated', 'statuses', results.values())
+        return results
+
+    def add_follow_up(self, app_id, follow_up_date, notes=""):
+        """Add follow-up reminder"""
+        with self._transaction():
+            cursor = self.conn.execute(
+                "UPDATE applications SET follow_up_date = ? WHERE id = ?", (follow_up_date, app_id)
+            )
+            if cursor.rowcount:
+                self._insert_event(app_id, make_event('follow_up', follow_up_date=follow_up_date, note=notes))
+
+        if cursor.rowcount:
+            print(f"✅ Follow-up added for #{app_id} on {follow_up_date}")
+            return True
+
+        return False
+
+    def add_note(self, app_id, note):
+        """Add a note to an application's history"""
+        with self._transaction():
+            if self.get_application(app_id) is None:
+                return False
+            self._insert_event(app_id, make_event('note', note=note))
+        return True
+
+    def get_application(self, app_id):
+        """Get an application by ID, or None"""
+        row = self.conn.execute('SELECT * FROM applications WHERE id = ?', (app_id,)).fetchone()
+        return dict(row) if row else None
+
+    def get_applications_by_status(self, status):
+        """Get all applications with specific status"""
+        rows = self.conn.execute('SELECT * FROM applications WHERE status = ? ORDER BY id', (status,))
+        return [dict(row) for row in rows]
+
+    def due_before(self, date=None):
+        """Open applications with a follow-up due on or before date (default today), soonest first"""
+        rows = self.conn.execute(
+            f'SELECT * FROM applications WHERE {OPEN_FOLLOWUPS_WHERE} ORDER BY follow_up_date, id',
+            (_date_key(date),) + CLOSED_STATUSES
+        )
+        return [dict(row) for row in rows]
+
+    def next_n(self, k):
+        """The k open applications with the soonest follow-ups"""
+        rows = self.conn.execute(
+            f'SELECT * FROM applications WHERE {OPEN_FOLLOWUPS_WHERE} ORDER BY follow_up_date, id LIMIT ?',
+            ('9999-12-31',) + CLOSED_STATUSES + (k,)
+        )
+        return [dict(row) for row in rows]
+
+    def dispatch_due_reminders(self, date=None):
+        """Run the reminder hooks for follow-ups that have fallen due
+
+        Dispatched follow-ups are recorded in the database, so each one is
+        reminded about once across restarts.
+        """
+        rows = self.conn.execute(
+            f'SELECT * FROM applications WHERE {OPEN_FOLLOWUPS_WHERE} AND NOT EXISTS ('
+            'SELECT 1 FROM follow_up_reminders r '
+            'WHERE r.app_id = applications.id AND r.follow_up_date = applications.follow_up_date'
+            ') ORDER BY follow_up_date, id',
+            (_date_key(date),) + CLOSED_STATUSES
+        )
+        due = [dict(row) for row in rows]
+
+        with self._transaction():
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO follow_up_reminders (app_id, follow_up_date) VALUES (?, ?)',
+                [(app['id'], app['follow_up_date']) for app in due]
+            )
+
+        for app in due:
+            for callback in self.reminder_hooks:
+                callback(app)
+        return due
+
+    def get_statistics(self):
+        """Get application statistics"""
+        total = self.conn.execute('SELECT COUNT(*) FROM applications').fetchone()[0]
+        if not total:
+            return {
+                'total': 0,
+                'by_status': {},
+                'by_company': {},
+                'response_rate': 0
+            }
+
+        by_status = self.conn.execute(
+            'SELECT status, COUNT(*) FROM applications GROUP BY status ORDER BY COUNT(*) DESC'
+        ).fetchall()
+        by_company = self.conn.execute(
+            'SELECT company, COUNT(*) FROM applications GROUP BY company ORDER BY COUNT(*) DESC'
+        ).fetchall()
+        # Today and the 7 days before it, as in the JSON tracker's daily counts
+        cutoff = (datetime.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
+        recent = self.conn.execute(
+            'SELECT COUNT(*) FROM applications WHERE date_applied >= ? AND date_applied < ?', (cutoff, tomorrow)
+        ).fetchone()[0]
+        responded = self.conn.execute(
+            f"SELECT COUNT(*) FROM applications WHERE status IN ({', '.join('?' for _ in RESPONDED_STATUSES)})",
+            RESPONDED_STATUSES
+        ).fetchone()[0]
+
+        return {
+            'total': total,
+            'by_status': dict(by_status),
+            'by_company': dict(by_company),
+            'recent_applications': recent,
+            'response_rate': responded / total * 100
+        }
+
+    def search_applications(self, keyword, limit=None):
+        """Search applications by keyword
+
+        Same semantics as ApplicationTracker: every word must prefix-match a
+        word in the title, company, notes or history notes, ranked with BM25
+        using the same field weights.
+        """
+        terms = tokenize(keyword)
+        limit_clause = f' LIMIT {int(limit)}' if limit is not None else ''
+        if not terms:
+            rows = self.conn.execute('SELECT * FROM applications ORDER BY id' + limit_clause)
+            return [dict(row) for row in rows]
+
+        # FTS5 drops the + and # in terms like C++ and C#, so those are also
+        # matched with LIKE
+        like_terms = terms if not self.has_fts else [term for term in terms if not term.isalnum()]
+        like_clause = ''.join(
+            ' AND (applications.job_title LIKE ? OR applications.company LIKE ? OR applications.notes LIKE ? '
+            'OR EXISTS (SELECT 1 FROM application_events '
+            'WHERE application_events.app_id = applications.id AND application_events.note LIKE ?))'
+            for _ in like_terms
+        )
+        params = [f"%{term}%" for term in like_terms for _ in range(4)]
+
+        if self.has_fts:
+            # Space-separated prefix terms are ANDed by FTS5
+            query = ' '.join(f'"{term}"*' for term in terms)
+            weights = ', '.join(str(float(weight)) for weight in SEARCH_FIELD_WEIGHTS.values())
+            rows = self.conn.execute(
+                'SELECT applications.* FROM applications_fts '
+                'JOIN applications ON applications.id = applications_fts.rowid '
+                f'WHERE applications_fts MATCH ?{like_clause} '
+                f'ORDER BY bm25(applications_fts, {weights}), applications.id{limit_clause}',
+                [query] + params
+            )
+        else:
+            rows = self.conn.execute(
+                f'SELECT * FROM applications WHERE 1 = 1{like_clause} ORDER BY id{limit_clause}', params
+            )
+
+        return [dict(row) for row in rows]
+
+    def _iter_applications(self):
+        """Stream applications from the database for export"""
+        cursor = self.conn.execute('SELECT * FROM applications ORDER BY id')
+        return (dict(row) for row in cursor)
+
+    def _reserve_ids(self, count):
+        """Nothing to reserve; AUTOINCREMENT hands out IDs on insert"""
+
+    def _import_application(self, record):
+        """Insert an exported application record (without committing) under a new ID"""
+        cursor = self.conn.execute(
+            f"INSERT INTO applications ({', '.join(COLUMNS[1:])}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS[1:])})",
+            tuple(record.get(column) if column != 'notes' else (record.get('notes') or '')
+                  for column in COLUMNS[1:])
+        )
+        self._insert_event(cursor.lastrowid, make_event('created', status=record.get('status'),
+                                                        source=record.get('source'),
+                                                        platform=job_platform(record.get('job_url'))))
+
+    def save(self):
+        """Commit any open transaction"""
+        self.conn.commit()
+
+    def flush(self):
+        """Commit any open transaction"""
+        self.conn.commit()
+
+    @contextmanager
+    def _transaction(self):
+        """Commit the block's writes, or leave them to the enclosing batch()"""
+        if self._batch_depth:
+            yield
+        else:
+            with self.conn:
+                yield
+
+    @contextmanager
+    def batch(self):
+        """Commit once at the end of the block, or roll back if it raises"""
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            if self._batch_depth == 1:
+                self.conn.rollback()
+            raise
+        else:
+            if self._batch_depth == 1:
+                self.conn.commit()
+        finally:
+            self._batch_depth -= 1
+
+    def close(self):
+        """Close the database connection"""
+        self.conn.close()
+
+
+def main():
+    """Migrate applications.json (or the given file) and show the dashboard"""
+    json_path = sys.argv[1] if len(sys.argv) > 1 else None
+    tracker = SQLiteApplicationTracker(json_path=json_path)
+    tracker.display_dashboard()
+
+
+if __name__ == "__main__":
+    main()
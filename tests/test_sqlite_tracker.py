@@ -0,0 +1,57 @@
+"""
+Tests for the SQLite application tracker
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlite_tracker import SQLiteApplicationTracker
+
+
+def make_tracker(tmp_path):
+    return SQLiteApplicationTracker(db_path=str(tmp_path / 'applications.db'),
+                                    json_path=str(tmp_path / 'missing.json'))
+
+
+def test_batch_rolls_back_when_block_raises(tmp_path):
+    tracker = make_tracker(tmp_path)
+    app_id = tracker.add_application('Data Scientist', 'Acme', 'https://example.com/1')
+
+    with pytest.raises(RuntimeError):
+        with tracker.batch():
+            tracker.add_application('ML Engineer', 'Beta', 'https://example.com/2')
+            tracker.update_status(app_id, 'Interview Scheduled', 'recruiter called')
+            tracker.update_statuses({app_id: 'Offer'})
+            tracker.add_follow_up(app_id, '2030-01-01')
+            tracker.add_note(app_id, 'salary discussed')
+            raise RuntimeError('abort')
+    tracker.close()
+
+    # A fresh connection sees only what was committed before the batch
+    tracker = make_tracker(tmp_path)
+    assert [app['id'] for app in tracker.applications] == [app_id]
+    app = tracker.get_application(app_id)
+    assert app['status'] == 'Applied'
+    assert app['follow_up_date'] is None
+    assert [event['type'] for event in tracker.get_history(app_id)] == ['created']
+    tracker.close()
+
+
+def test_batch_commits_once_at_the_end(tmp_path):
+    tracker = make_tracker(tmp_path)
+
+    with tracker.batch():
+        app_id = tracker.add_application('Data Scientist', 'Acme', 'https://example.com/1')
+        with tracker.batch():
+            tracker.update_status(app_id, 'Offer')
+        # Still uncommitted after the nested batch
+        assert tracker.conn.in_transaction
+    tracker.close()
+
+    tracker = make_tracker(tmp_path)
+    assert tracker.get_application(app_id)['status'] == 'Offer'
+    tracker.close()
@@ -3,26 +3,64 @@ Job Application System - Web Interface
 Flask web application for managing job applications
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
+from flask import Flask, render_template, jsonify, request, send_file, Response
 import json
 import os
 import threading
 import time
+from datetime import date
 from application_tracker import ApplicationTracker
+from application_analytics import ApplicationAnalytics
+from application_catalog import ApplicationCatalog
+from http_cache import ResponseCache
 from resume_tailor import ResumeTailor
 from cover_letter_generator import CoverLetterGenerator
 from job_scraper import JobScraper
+from job_scoring import get_engine
+from list_query import query_items, wants_page
+from search_events import EventBroker
+from search_queue import SearchQueue
 
 # Base directory - use current working directory
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# Global variable to track search status
-search_status = {
-    'running': False,
-    'progress': 0,
-    'message': '',
-    'total_jobs': 0
-}
+# Searches waiting or running, kept in SQLite so they survive a restart.
+# One runs at a time, across every server process sharing the database:
+# each search writes applications_comprehensive and jobs_comprehensive.json,
+# and picks up the newest tailored resume and cover letter files, which
+# concurrent searches would trip over.
+SEARCH_WORKERS = 1
+search_queue = None
+search_queue_lock = threading.Lock()
+
+# Live search progress for /api/search_events streams
+search_events = EventBroker()
+
+# Tracker shared by all requests, so its statistics are kept up to date
+# incrementally; it picks up saves from other processes with refresh()
+tracker = None
+tracker_lock = threading.Lock()
+
+# Analytics views, created on first request and refreshed incrementally
+analytics = None
+analytics_lock = threading.Lock()
+
+# Folders holding generated applications, one subfolder per job
+BATCH_DIRS = [
+    os.path.join(BASE_DIR, 'applications_batch'),
+    os.path.join(BASE_DIR, 'applications_comprehensive')
+]
+
+# In-memory index of the application folders, kept current by a watcher
+catalog = None
+catalog_lock = threading.Lock()
+
+# Serialized (and compressed) API responses, reused until their data changes
+response_cache = ResponseCache()
+
+# Fields searched by the ?q= filter on list endpoints
+APPLICATION_TEXT_FIELDS = ('job_title', 'company', 'location')
+JOB_TEXT_FIELDS = ('title', 'company', 'location')
 
 app = Flask(__name__)
 
@@ -34,68 +72,101 @@ def index():
 @app.route('/api/dashboard')
 def get_dashboard():
     """Get dashboard statistics"""
-    tracker = ApplicationTracker()
-    stats = tracker.get_statistics()
-    return jsonify(stats)
+    # Statistics depend on the tracker file and, for recent counts, on today's date
+    version = f"{file_version(os.path.join(BASE_DIR, 'applications.json'))}:{date.today()}"
+    return response_cache.respond(version, lambda: get_tracker().get_statistics())
+
+@app.route('/api/analytics')
+def get_analytics():
+    """Get conversion funnel, weekly/source/platform rollups and response times"""
+    return jsonify(get_analytics_views().get_views())
+
+def get_analytics_views():
+    """The shared analytics views, created on first use"""
+    global analytics
+
+    tracker = get_tracker()
+    with analytics_lock:
+        if analytics is None:
+            analytics = ApplicationAnalytics(tracker)
+        return analytics
 
 @app.route('/api/applications')
 def get_applications():
-    """Get all applications"""
-    tracker = ApplicationTracker()
+    """Get all applications, or one filtered page of them
 
-    # Load application info from both batch folders
-    batch_dirs = [
-        os.path.join(BASE_DIR, 'applications_batch'),
-        os.path.join(BASE_DIR, 'applications_comprehensive')
-    ]
-    applications = []
+    With any list parameter (limit, cursor, fields, sort, q, status, source,
+    min_score, max_score; see list_query) the response is a page:
+    {'items', 'next_cursor', 'total'}, plus dashboard 'summary' numbers
+    when ?summary=1.
+    """
+    catalog = get_catalog()
 
-    for batch_dir in batch_dirs:
-        if os.path.exists(batch_dir):
-            for company_folder in os.listdir(batch_dir):
-                folder_path = os.path.join(batch_dir, company_folder)
-                if os.path.isdir(folder_path):
-                    info_file = os.path.join(folder_path, 'application_info.json')
-                    if os.path.exists(info_file):
-                        with open(info_file, 'r') as f:
-                            app_info = json.load(f)
-                            app_info['folder'] = os.path.join(os.path.basename(batch_dir), company_folder)
+    def build():
+        applications = catalog.applications()
 
-                            # Add priority score if not present
-                            if 'priority_score' not in app_info:
-                                app_info['priority_score'] = calculate_priority_score(app_info)
+        if not wants_page(request.args):
+            # Sort by priority score (highest first)
+            return sorted(applications, key=lambda x: x.get('priority_score', 0), reverse=True)
 
-                            applications.append(app_info)
+        page = query_items(applications, request.args, 'folder', APPLICATION_TEXT_FIELDS,
+                           default_sort='-priority_score')
+        if request.args.get('summary'):
+            page['summary'] = summarize_applications(applications)
+        return page
 
-    # Sort by priority score (highest first)
-    applications.sort(key=lambda x: x.get('priority_score', 0), reverse=True)
+    try:
+        return response_cache.respond(catalog.data_version(), build)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
-    return jsonify(applications)
+def file_version(path):
+    """Token that changes whenever a file is rewritten"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return 'missing'
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+def summarize_applications(applications):
+    """Dashboard numbers over all applications"""
+    matches = []
+    for app_info in applications:
+        try:
+            matches.append(float(str(app_info.get('skill_match') or 0).rstrip('%')))
+        except ValueError:
+            matches.append(0.0)
+
+    return {
+        'total': len(applications),
+        'ready': sum(1 for app_info in applications if app_info.get('status') == 'Ready to Apply'),
+        'high_priority': sum(1 for app_info in applications if app_info.get('priority_score', 0) >= 50),
+        'avg_match': sum(matches) / len(matches) if matches else 0
+    }
+
+def get_tracker():
+    """The shared application tracker, with other processes' saves merged in"""
+    global tracker
+
+    with tracker_lock:
+        if tracker is None:
+            tracker = ApplicationTracker()
+        else:
+            tracker.refresh()
+        return tracker
+
+def get_catalog():
+    """The application catalog, built on first use"""
+    global catalog
+
+    with catalog_lock:
+        if catalog is None:
+            catalog = ApplicationCatalog(BATCH_DIRS)
+        return catalog
 
 def calculate_priority_score(job):
     """Calculate priority score for a job"""
-    score = 0
-    title = job.get('job_title', '').lower()
-    company = job.get('company', '').lower()
-
-    # HIGH PRIORITY KEYWORDS
-    if any(keyword in title for keyword in ['intern', 'internship', 'graduate', 'entry level', 'junior', 'undergraduate']):
-        score += 20
-
-    # TOP COMPANIES
-    top_companies = ['google', 'microsoft', 'tiktok', 'meta', 'amazon', 'apple', 'atlassian', 'canva', 'ey', 'deloitte']
-    if any(top_company in company for top_company in top_companies):
-        score += 50
-
-    # RELEVANT ROLES
-    if any(role in title for role in ['data scientist', 'data analyst', 'machine learning', 'ml engineer', 'java developer']):
-        score += 15
-
-    # PENALTY: Senior roles
-    if any(word in title for word in ['senior', 'lead', 'principal', 'staff']):
-        score -= 30
-
-    return max(0, score)
+    return get_engine().score(job)
 
 @app.route('/api/application/<path:company_folder>')
 def get_application_details(company_folder):
@@ -149,19 +220,38 @@ def download_file(company_folder, file_type):
 
 @app.route('/api/jobs')
 def get_jobs():
-    """Get scraped jobs"""
+    """Get scraped jobs, or one filtered page of them (same parameters as /api/applications)"""
     jobs_file = os.path.join(BASE_DIR, 'jobs.json')
-    if os.path.exists(jobs_file):
-        with open(jobs_file, 'r') as f:
-            jobs = json.load(f)
-        return jsonify(jobs)
-    return jsonify([])
+
+    def build():
+        jobs = []
+        if os.path.exists(jobs_file):
+            with open(jobs_file, 'r') as f:
+                jobs = json.load(f)
+
+        if not wants_page(request.args):
+            return jobs
+
+        # Scraped jobs aren't scored yet; score them so they can be filtered and sorted
+        unscored = [i for i, job in enumerate(jobs) if 'priority_score' not in job]
+        if unscored:
+            scores = get_engine().score_many([jobs[i] for i in unscored]).tolist()
+            for i, score in zip(unscored, scores):
+                jobs[i] = dict(jobs[i], priority_score=score)
+
+        return query_items(jobs, request.args, 'url', JOB_TEXT_FIELDS)
+
+    version = f"{file_version(jobs_file)}:{get_engine().rules_hash}"
+    try:
+        return response_cache.respond(version, build)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
 @app.route('/api/update_status', methods=['POST'])
 def update_status():
     """Update application status"""
     data = request.json
-    tracker = ApplicationTracker()
+    tracker = get_tracker()
 
     # Find application by company name
     for app in tracker.applications:
@@ -171,6 +261,42 @@ def update_status():
 
     return jsonify({'error': 'Application not found'}), 404
 
+@app.route('/api/update_statuses', methods=['POST'])
+def update_statuses():
+    """Update the status of several applications at once"""
+    updates = request.json.get('updates', [])
+    tracker = get_tracker()
+
+    # Resolve companies to application IDs the same way update_status does
+    ids_by_company = {}
+    for app in tracker.applications:
+        ids_by_company.setdefault(app['company'], app['id'])
+
+    mapping = {}
+    results = []
+    for update in updates:
+        app_id = update.get('id', ids_by_company.get(update.get('company')))
+        if app_id is None:
+            results.append({'company': update.get('company'), 'success': False, 'error': 'Application not found'})
+            continue
+        mapping[app_id] = {'status': update.get('status'), 'notes': update.get('notes', '')}
+        results.append({'company': update.get('company'), 'id': app_id})
+
+    applied = tracker.update_statuses(mapping)
+    for result in results:
+        if 'id' in result:
+            result.update(applied[result['id']])
+
+    return jsonify({'success': all(result['success'] for result in results), 'results': results})
+
+@app.route('/api/history/<int:app_id>')
+def get_history(app_id):
+    """Get the status and follow-up history of a tracked application"""
+    tracker = get_tracker()
+    if tracker.get_application(app_id) is None:
+        return jsonify({'error': 'Application not found'}), 404
+    return jsonify(tracker.get_history(app_id))
+
 @app.route('/api/mark_applied', methods=['POST'])
 def mark_applied():
     """Mark an application as applied when link is clicked"""
@@ -179,41 +305,27 @@ def mark_applied():
     job_title = data.get('job_title')
 
     # Update the application_info.json file
-    batch_dirs = [
-        os.path.join(BASE_DIR, 'applications_batch'),
-        os.path.join(BASE_DIR, 'applications_comprehensive')
-    ]
+    found = get_catalog().find(company=company, job_title=job_title)
+    if found is None:
+        return jsonify({'success': False, 'error': 'Application not found'}), 404
 
-    for batch_dir in batch_dirs:
-        if os.path.exists(batch_dir):
-            for company_folder in os.listdir(batch_dir):
-                folder_path = os.path.join(batch_dir, company_folder)
-                if os.path.isdir(folder_path):
-                    info_file = os.path.join(folder_path, 'application_info.json')
-                    if os.path.exists(info_file):
-                        with open(info_file, 'r') as f:
-                            app_info = json.load(f)
-
-                        if app_info.get('company') == company and app_info.get('job_title') == job_title:
-                            # Mark as applied
-                            app_info['status'] = 'Applied'
-                            app_info['applied_date'] = request.json.get('timestamp')
+    folder, info_file = found
+    with open(info_file, 'r') as f:
+        app_info = json.load(f)
 
-                            with open(info_file, 'w') as f:
-                                json.dump(app_info, f, indent=2)
+    # Mark as applied
+    app_info['status'] = 'Applied'
+    app_info['applied_date'] = request.json.get('timestamp')
 
-                            return jsonify({'success': True})
+    with open(info_file, 'w') as f:
+        json.dump(app_info, f, indent=2)
 
-    return jsonify({'success': False, 'error': 'Application not found'}), 404
+    get_catalog().invalidate(folder)
+    return jsonify({'success': True})
 
 @app.route('/api/search_jobs', methods=['POST'])
 def search_jobs():
-    """Trigger new job search"""
-    global search_status
-
-    if search_status['running']:
-        return jsonify({'error': 'Search already in progress'}), 400
-
+    """Queue a new job search"""
     data = request.json
     keywords = data.get('keywords', [])
     location = data.get('location', 'Sydney')
@@ -224,17 +336,80 @@ def search_jobs():
     if not keywords:
         return jsonify({'error': 'Please provide at least one keyword'}), 400
 
-    # Start search in background thread
-    thread = threading.Thread(target=run_job_search, args=(keywords, location, country, platforms, clear_old))
-    thread.daemon = True
-    thread.start()
-
-    return jsonify({'success': True, 'message': 'Job search started'})
+    try:
+        priority = int(data.get('priority', 0))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'priority must be a number'}), 400
+
+    job = get_search_queue().submit({
+        'keywords': keywords,
+        'location': location,
+        'country': country,
+        'platforms': platforms,
+        'clear_old': clear_old
+    }, priority=priority)
+
+    return jsonify({'success': True, 'message': 'Job search queued', 'job_id': job['id'], 'job': job})
+
+@app.route('/api/search_jobs')
+def list_search_jobs():
+    """Recent searches, newest first (?state=queued,running to filter)"""
+    states = [state for state in request.args.get('state', '').split(',') if state]
+    try:
+        limit = min(int(request.args.get('limit', 50)), 500)
+    except ValueError:
+        return jsonify({'error': 'limit must be a number'}), 400
+    return jsonify({'jobs': get_search_queue().jobs(states=states, limit=limit)})
+
+@app.route('/api/search_jobs/<int:job_id>')
+def get_search_job(job_id):
+    """One search's state and progress"""
+    job = get_search_queue().get(job_id)
+    if job is None:
+        return jsonify({'error': 'Search not found'}), 404
+    return jsonify(job)
+
+@app.route('/api/search_jobs/<int:job_id>/cancel', methods=['POST'])
+def cancel_search_job(job_id):
+    """Cancel a queued or running search"""
+    job = get_search_queue().cancel(job_id)
+    if job is None:
+        return jsonify({'error': 'Search not found'}), 404
+    return jsonify({'success': True, 'job': job})
 
 @app.route('/api/search_status')
 def get_search_status():
     """Get current search status"""
-    return jsonify(search_status)
+    return jsonify(get_search_queue().status())
+
+@app.route('/api/search_events')
+def get_search_events():
+    """Stream search progress, platform results and new applications (SSE)"""
+    # Browsers send Last-Event-ID when reconnecting; the query parameter
+    # lets a fresh EventSource resume too
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    stream = search_events.stream(last_event_id, snapshot=lambda: ('status', get_search_queue().status()))
+    response = Response(stream, mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # Stop nginx from buffering the stream
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+def get_search_queue():
+    """The search queue, started on first use"""
+    global search_queue
+
+    with search_queue_lock:
+        if search_queue is None:
+            search_queue = SearchQueue(os.path.join(BASE_DIR, 'search_jobs.db'), run_job_search,
+                                       max_workers=SEARCH_WORKERS, on_change=publish_search_job)
+            search_queue.start()
+        return search_queue
+
+def publish_search_job(job, status):
+    """Push a search's new state, and the queue summary, to event streams"""
+    search_events.publish('job', job)
+    search_events.publish('status', status)
 
 @app.route('/api/clear_jobs', methods=['POST'])
 def clear_jobs():
@@ -252,183 +427,194 @@ def clear_jobs():
             if os.path.exists(folder):
                 shutil.rmtree(folder)
                 os.makedirs(folder, exist_ok=True)
+        get_catalog().invalidate()
 
         return jsonify({'success': True, 'message': 'All jobs cleared'})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
-def run_job_search(keywords, location, country, platforms, clear_old):
-    """Run job search in background"""
-    global search_status
+def run_job_search(task):
+    """Run one queued job search (called by the search queue's workers)"""
+    keywords = task.params['keywords']
+    location = task.params['location']
+    country = task.params['country']
+    platforms = task.params['platforms']
+    clear_old = task.params['clear_old']
+
+    # Clear old jobs if requested
+    if clear_old:
+        task.update(message='Clearing old jobs...')
+        import shutil
+        comp_dir = os.path.join(BASE_DIR, 'applications_comprehensive')
+        if os.path.exists(comp_dir):
+            for item in os.listdir(comp_dir):
+                item_path = os.path.join(comp_dir, item)
+                if os.path.isdir(item_path):
+                    shutil.rmtree(item_path)
+        get_catalog().invalidate()
+
+    # Initialize scraper
+    scraper = JobScraper()
+    tailor = ResumeTailor()
+    cover_gen = CoverLetterGenerator()
+    tracker = ApplicationTracker()
 
-    try:
-        search_status['running'] = True
-        search_status['progress'] = 0
-        search_status['message'] = 'Initializing search...'
-        search_status['total_jobs'] = 0
-
-        # Clear old jobs if requested
-        if clear_old:
-            search_status['message'] = 'Clearing old jobs...'
-            import shutil
-            comp_dir = os.path.join(BASE_DIR, 'applications_comprehensive')
-            if os.path.exists(comp_dir):
-                for item in os.listdir(comp_dir):
-                    item_path = os.path.join(comp_dir, item)
-                    if os.path.isdir(item_path):
-                        shutil.rmtree(item_path)
-
-        # Initialize scraper
-        scraper = JobScraper()
-        tailor = ResumeTailor()
-        cover_gen = CoverLetterGenerator()
-        tracker = ApplicationTracker()
-
-        # Supported platforms
-        supported_platforms = {'seek', 'indeed', 'linkedin', 'naukri', 'monster', 'glassdoor', 'reed', 'totaljobs'}
-        unsupported = [p for p in platforms if p not in supported_platforms]
-
-        # Filter to only supported platforms
-        supported = [p for p in platforms if p in supported_platforms]
-
-        total_searches = len(keywords) * len(supported)
-        current_search = 0
-
-        # Show message about unsupported platforms
-        if unsupported:
-            search_status['message'] = f'Note: {", ".join(unsupported)} scrapers coming soon! Searching with: {", ".join(supported)}'
-            time.sleep(2)
-
-        # Search each keyword on each platform
-        for keyword in keywords:
-            for platform in supported:
-                current_search += 1
-                search_status['progress'] = int((current_search / total_searches) * 50)  # 50% for searching
-                search_status['message'] = f'Searching {platform.title()} for "{keyword}"...'
-
-                try:
-                    if platform == 'seek':
-                        # Seek is Australia-only
-                        if country == 'australia':
-                            scraper.scrape_seek(keyword, location)
-                    elif platform == 'indeed':
-                        # Pass country to Indeed scraper
-                        scraper.scrape_indeed(keyword, location, country)
-                    elif platform == 'linkedin':
-                        # Pass country to LinkedIn scraper
-                        scraper.scrape_linkedin(keyword, location, country)
-                    elif platform == 'naukri':
-                        # Naukri is India-focused
-                        scraper.scrape_naukri(keyword, location, country)
-                    elif platform == 'monster':
-                        # Monster for USA and other countries
-                        scraper.scrape_monster(keyword, location, country)
-                    elif platform == 'glassdoor':
-                        # Glassdoor for USA
-                        scraper.scrape_glassdoor(keyword, location, country)
-                    elif platform == 'reed':
-                        # Reed for UK
-                        scraper.scrape_reed(keyword, location, country)
-                    elif platform == 'totaljobs':
-                        # TotalJobs for UK
-                        scraper.scrape_totaljobs(keyword, location, country)
-                    time.sleep(2)  # Be respectful with requests
-                except Exception as e:
-                    print(f"Error scraping {platform}: {e}")
-
-        # Get unique jobs
-        jobs = scraper.get_jobs()
-        unique_jobs = []
-        seen_urls = set()
-        for job in jobs:
-            if job['url'] not in seen_urls:
-                unique_jobs.append(job)
-                seen_urls.add(job['url'])
-
-        search_status['total_jobs'] = len(unique_jobs)
-        search_status['message'] = f'Found {len(unique_jobs)} jobs! Preparing applications...'
-
-        # Save jobs
-        scraper.jobs = unique_jobs
-        scraper.save_to_json(os.path.join(BASE_DIR, 'jobs_comprehensive.json'))
-        scraper.save_to_csv(os.path.join(BASE_DIR, 'jobs_comprehensive.csv'))
-
-        # Prepare applications
-        output_dir = os.path.join(BASE_DIR, 'applications_comprehensive')
-        os.makedirs(output_dir, exist_ok=True)
-
-        for i, job in enumerate(unique_jobs):
-            search_status['progress'] = 50 + int(((i + 1) / len(unique_jobs)) * 50)  # 50-100% for processing
-            search_status['message'] = f'Processing {i+1}/{len(unique_jobs)}: {job["title"]} at {job["company"]}'
+    # Supported platforms
+    supported_platforms = {'seek', 'indeed', 'linkedin', 'naukri', 'monster', 'glassdoor', 'reed', 'totaljobs'}
+    unsupported = [p for p in platforms if p not in supported_platforms]
 
-            try:
-                # Create company folder
-                company_folder = os.path.join(output_dir, f"{job['company'].replace('/', '_').replace('|', '_')}_{i+1}")
-                os.makedirs(company_folder, exist_ok=True)
-
-                # Create job description
-                job_desc = create_job_description(job)
-
-                # Tailor resume
-                tailored_resume = tailor.generate_tailored_resume(
-                    job_description=job_desc,
-                    job_title=job['title'],
-                    company_name=job['company'],
-                    output_format='text'
-                )
-
-                # Move files
-                import glob
-                latest_resume = max(glob.glob(os.path.join(BASE_DIR, 'tailored_resume_*.txt')),
-                                   key=os.path.getctime, default=None)
-                if latest_resume:
-                    os.rename(latest_resume, os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.txt"))
-
-                latest_resume_json = max(glob.glob(os.path.join(BASE_DIR, 'tailored_resume_*.json')),
-                                        key=os.path.getctime, default=None)
-                if latest_resume_json:
-                    os.rename(latest_resume_json, os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.json"))
-
-                # Generate cover letter
-                cover_letter = cover_gen.generate_cover_letter(
-                    job_description=job_desc,
-                    job_title=job['title'],
-                    company_name=job['company']
-                )
-
-                latest_cover = max(glob.glob(os.path.join(BASE_DIR, 'cover_letter_*.txt')),
-                                  key=os.path.getctime, default=None)
-                if latest_cover:
-                    os.rename(latest_cover, os.path.join(company_folder, f"cover_letter_{job['company'].replace('/', '_')}.txt"))
-
-                # Save application info
-                app_info = {
-                    'job_title': job['title'],
-                    'company': job['company'],
-                    'location': job['location'],
-                    'url': job['url'],
-                    'source': job['source'],
-                    'skill_match': f"{tailored_resume['skill_match_analysis']['match_percentage']:.1f}%",
-                    'matched_skills': tailored_resume['skill_match_analysis']['matched'],
-                    'status': 'Ready to Apply',
-                    'priority_score': calculate_priority_score({'job_title': job['title'], 'company': job['company']})
-                }
-
-                with open(os.path.join(company_folder, 'application_info.json'), 'w') as f:
-                    json.dump(app_info, f, indent=2)
+    # Filter to only supported platforms
+    supported = [p for p in platforms if p in supported_platforms]
 
-            except Exception as e:
-                print(f"Error processing {job['title']}: {e}")
+    total_searches = len(keywords) * len(supported)
+    current_search = 0
 
-        search_status['progress'] = 100
-        search_status['message'] = f'Complete! Found and processed {len(unique_jobs)} jobs.'
-        time.sleep(3)  # Keep message visible
+    # Show message about unsupported platforms
+    if unsupported:
+        task.update(message=f'Note: {", ".join(unsupported)} scrapers coming soon! Searching with: {", ".join(supported)}')
+        time.sleep(2)
 
-    except Exception as e:
-        search_status['message'] = f'Error: {str(e)}'
-        print(f"Search error: {e}")
-    finally:
-        search_status['running'] = False
+    # Search each keyword on each platform
+    for keyword in keywords:
+        for platform in supported:
+            current_search += 1
+            task.update(
+                progress=int((current_search / total_searches) * 50),  # 50% for searching
+                message=f'Searching {platform.title()} for "{keyword}"...'
+            )
+            jobs_before = len(scraper.jobs)
+            error = None
+
+            try:
+                if platform == 'seek':
+                    # Seek is Australia-only
+                    if country == 'australia':
+                        scraper.scrape_seek(keyword, location)
+                elif platform == 'indeed':
+                    # Pass country to Indeed scraper
+                    scraper.scrape_indeed(keyword, location, country)
+                elif platform == 'linkedin':
+                    # Pass country to LinkedIn scraper
+                    scraper.scrape_linkedin(keyword, location, country)
+                elif platform == 'naukri':
+                    # Naukri is India-focused
+                    scraper.scrape_naukri(keyword, location, country)
+                elif platform == 'monster':
+                    # Monster for USA and other countries
+                    scraper.scrape_monster(keyword, location, country)
+                elif platform == 'glassdoor':
+                    # Glassdoor for USA
+                    scraper.scrape_glassdoor(keyword, location, country)
+                elif platform == 'reed':
+                    # Reed for UK
+                    scraper.scrape_reed(keyword, location, country)
+                elif platform == 'totaljobs':
+                    # TotalJobs for UK
+                    scraper.scrape_totaljobs(keyword, location, country)
+                time.sleep(2)  # Be respectful with requests
+            except Exception as e:
+                error = str(e)
+                print(f"Error scraping {platform}: {e}")
+
+            search_events.publish('platform', {
+                'platform': platform,
+                'keyword': keyword,
+                'found': len(scraper.jobs) - jobs_before,
+                'error': error,
+                'job_id': task.id
+            })
+
+    # Get unique jobs
+    jobs = scraper.get_jobs()
+    unique_jobs = []
+    seen_urls = set()
+    for job in jobs:
+        if job['url'] not in seen_urls:
+            unique_jobs.append(job)
+            seen_urls.add(job['url'])
+
+    task.update(total_jobs=len(unique_jobs), message=f'Found {len(unique_jobs)} jobs! Preparing applications...')
+
+    # Save jobs
+    scraper.jobs = unique_jobs
+    scraper.save_to_json(os.path.join(BASE_DIR, 'jobs_comprehensive.json'))
+    scraper.save_to_csv(os.path.join(BASE_DIR, 'jobs_comprehensive.csv'))
+
+    # Prepare applications
+    output_dir = os.path.join(BASE_DIR, 'applications_comprehensive')
+    os.makedirs(output_dir, exist_ok=True)
+
+    for i, job in enumerate(unique_jobs):
+        task.update(
+            progress=50 + int(((i + 1) / len(unique_jobs)) * 50),  # 50-100% for processing
+            message=f'Processing {i+1}/{len(unique_jobs)}: {job["title"]} at {job["company"]}'
+        )
+
+        try:
+            # Create company folder
+            company_folder = os.path.join(output_dir, f"{job['company'].replace('/', '_').replace('|', '_')}_{i+1}")
+            os.makedirs(company_folder, exist_ok=True)
+
+            # Create job description
+            job_desc = create_job_description(job)
+
+            # Tailor resume
+            tailored_resume = tailor.generate_tailored_resume(
+                job_description=job_desc,
+                job_title=job['title'],
+                company_name=job['company'],
+                output_format='text'
+            )
+
+            # Move files
+            import glob
+            latest_resume = max(glob.glob(os.path.join(BASE_DIR, 'tailored_resume_*.txt')),
+                               key=os.path.getctime, default=None)
+            if latest_resume:
+                os.rename(latest_resume, os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.txt"))
+
+            latest_resume_json = max(glob.glob(os.path.join(BASE_DIR, 'tailored_resume_*.json')),
+                                    key=os.path.getctime, default=None)
+            if latest_resume_json:
+                os.rename(latest_resume_json, os.path.join(company_folder, f"resume_{job['company'].replace('/', '_')}.json"))
+
+            # Generate cover letter
+            cover_letter = cover_gen.generate_cover_letter(
+                job_description=job_desc,
+                job_title=job['title'],
+                company_name=job['company']
+            )
+
+            latest_cover = max(glob.glob(os.path.join(BASE_DIR, 'cover_letter_*.txt')),
+                              key=os.path.getctime, default=None)
+            if latest_cover:
+                os.rename(latest_cover, os.path.join(company_folder, f"cover_letter_{job['company'].replace('/', '_')}.txt"))
+
+            # Save application info
+            app_info = {
+                'job_title': job['title'],
+                'company': job['company'],
+                'location': job['location'],
+                'url': job['url'],
+                'source': job['source'],
+                'skill_match': f"{tailored_resume['skill_match_analysis']['match_percentage']:.1f}%",
+                'matched_skills': tailored_resume['skill_match_analysis']['matched'],
+                'status': 'Ready to Apply',
+                'priority_score': calculate_priority_score(job)
+            }
+
+            with open(os.path.join(company_folder, 'application_info.json'), 'w') as f:
+                json.dump(app_info, f, indent=2)
+            get_catalog().invalidate_path(company_folder)
+            search_events.publish('application', dict(
+                app_info, folder=os.path.join(os.path.basename(output_dir), os.path.basename(company_folder)),
+                job_id=task.id
+            ))
+
+        except Exception as e:
+            print(f"Error processing {job['title']}: {e}")
+
+    task.update(progress=100, message=f'Complete! Found and processed {len(unique_jobs)} jobs.')
 
 def create_job_description(job):
     """Create a generic job description based on title"""
@@ -457,4 +643,9 @@ if __name__ == '__main__':
     print("\n⚠️  Press Ctrl+C to stop the server")
     print("="*80 + "\n")
 
+    # Resume searches left queued by the last run; under the reloader, only
+    # in the child process that serves requests
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        get_search_queue()
+
     app.run(debug=True, port=5000)